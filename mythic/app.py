@@ -1,9 +1,10 @@
 from PySide6.QtWidgets import QApplication, QMainWindow, QLabel, QStackedWidget, QWidget
-from PySide6.QtGui import QPixmap, QImage
-from PySide6.QtCore import Qt, QSize
-from PIL import Image
+from PySide6.QtGui import QPixmap
+from PySide6.QtCore import Qt, QSize, QThreadPool
 from views.main_menu import MainMenu  # Assuming MainMenu is adapted for PySide6
+from views.view_manager import ViewManager
 from models.db_config import initialize_db
+from utils.background_cache import BackgroundCache, BackgroundLoadTask
 
 
 class MainAppWindow(QMainWindow):
@@ -16,15 +17,23 @@ class MainAppWindow(QMainWindow):
         # Background label for displaying images
         self.bg_label = QLabel(self)
         self.bg_label.setScaledContents(True)
+        # Scaled backgrounds, kept in memory and as pre-scaled files next to the originals
+        self.background_cache = BackgroundCache(cache_dir="visuals/backgrounds/.cache")
+        # Cache misses are decoded off the GUI thread; the current background stays up meanwhile
+        self.background_pool = QThreadPool(self)
+        self.background_pool.setMaxThreadCount(2)
+        self.background_tasks = {}  # In-flight loads by cache key
+        self.requested_background_key = None
 
         # Container for dynamic views
         self.container = QStackedWidget(self)
         self.setCentralWidget(self.container)
 
+        # Views are created, cached and disposed of by the view manager
+        self.view_manager = ViewManager(self.container, self)
+
         # Load MainMenu as the first view
-        self.current_view = MainMenu(self.container, self)
-        self.container.addWidget(self.current_view)
-        self.container.setCurrentWidget(self.current_view)
+        self.current_view = self.view_manager.show(MainMenu)
         # Set font and background color for tooltips throughout the app
         self.setStyleSheet("""
             QToolTip {
@@ -45,9 +54,7 @@ class MainAppWindow(QMainWindow):
             print(f"Error: {view_class} is not a valid QWidget subclass.")
             return
 
-        new_view = view_class(self.container, self, **kwargs)
-        self.container.addWidget(new_view)
-        self.container.setCurrentWidget(new_view)
+        new_view = self.view_manager.show(view_class, **kwargs)
 
         if hasattr(new_view, "get_background_image"):
             self.update_background(new_view.get_background_image())
@@ -55,19 +62,31 @@ class MainAppWindow(QMainWindow):
         self.current_view = new_view
 
     def update_background(self, image_path):
-        """Loads and scales the background image dynamically without saving a temp file."""
+        """Shows the background image scaled to the window, decoding it on a worker thread on a cache miss."""
         try:
-            img = Image.open(image_path)
-            new_size = (self.width(), self.height())
+            key = self.background_cache.key(image_path, (self.width(), self.height()))
+        except (OSError, TypeError):
+            return  # Missing file or no background for this view; keep the current one
+
+        self.requested_background_key = key
+        pixmap = self.background_cache.get(key)
+        if pixmap is not None:
+            self.set_background_pixmap(pixmap)
+        elif key not in self.background_tasks:
+            task = BackgroundLoadTask(self.background_cache, key)
+            task.signals.loaded.connect(self.background_loaded)
+            task.signals.failed.connect(lambda failed_key: self.background_tasks.pop(failed_key, None))
+            self.background_tasks[key] = task
+            self.background_pool.start(task)
 
-            # Resize only if necessary
-            if img.size != new_size:
-                img = img.resize(new_size, Image.Resampling.LANCZOS)
+    def background_loaded(self, key, image):
+        """Caches a background decoded by a worker and swaps it in if it is still the one wanted."""
+        self.background_tasks.pop(key, None)
+        pixmap = QPixmap.fromImage(image)
+        self.background_cache.put(key, pixmap)
+        if key == self.requested_background_key:
+            self.set_background_pixmap(pixmap)
 
-            # Convert PIL image to QPixmap without saving a temp file
-            qimage = QImage(img.tobytes(), img.width, img.height, img.width * 3, QImage.Format_RGB888)
-            pixmap = QPixmap.fromImage(qimage)
-            self.bg_label.setPixmap(pixmap)
-            self.bg_label.setGeometry(self.rect())
-        except Exception:
-            pass
\ No newline at end of file
+    def set_background_pixmap(self, pixmap):
+        self.bg_label.setPixmap(pixmap)
+        self.bg_label.setGeometry(self.rect())
\ No newline at end of file
@@ -0,0 +1,134 @@
+"""Batch oracle runner: reads JSONL requests and writes one JSONL result per request, without Qt.
+
+Run from the mythic directory:
+
+    python -m cli [requests.jsonl] [--seed N] [--chaos-factor N] [--chunk-size N] > results.jsonl
+
+Each input line is an object with an "op":
+    {"op": "fate", "odds": "likely", "cf": 5}          roll is drawn unless given as "roll"
+    {"op": "meaning", "table": "Actions", "count": 2}
+    {"op": "event"}                                     random event at the current chaos factor
+    {"op": "end_scene", "in_control": true}             adjusts the chaos factor
+"cf" defaults to the running chaos factor, and an "id" field is copied to the result. A line that
+cannot be handled produces {"line": n, "error": "..."} and processing continues. Fate rolls come
+from their own stream under the seed, drawn a chunk at a time with line n taking the nth roll, and
+events and meanings from another, so a seed reproduces its results for the same input whatever the
+chunk size.
+"""
+import argparse
+import json
+import sys
+from itertools import islice
+from core.oracle import Oracle, triggers_random_event
+from core.rng import StreamRandom
+from utils.oracles import fate_chart
+
+
+DEFAULT_CHUNK_SIZE = 10000
+D100 = range(1, 101)
+# Spawn keys, under the seed, of the fate question rolls and of every other roll
+FATE_ROLL_STREAM, ORACLE_STREAM = 0, 1
+
+_DECODER = json.JSONDecoder()
+# Fate results without a random event or id are the bulk of most streams and have only
+# 100 rolls x 4 answers possible encodings, so each is encoded once
+_PLAIN_FATE_LINES = {}
+
+
+def event_json(event):
+    return {"focus_roll": event.focus_roll, "focus": event.focus, "meaning": list(event.meaning)}
+
+
+def encode_response(response):
+    """Returns the JSON line for a result object."""
+    if len(response) == 2 and "roll" in response:
+        key = (response["roll"], response["answer"])
+        line = _PLAIN_FATE_LINES.get(key)
+        if line is None:
+            line = _PLAIN_FATE_LINES[key] = json.dumps(response)
+        return line
+    return json.dumps(response)
+
+
+def handle_request(request, oracle, roll=None):
+    """Returns the result object for one parsed request; roll is the d100 to use for a fate question."""
+    op = request.get("op", "fate")
+    if op == "fate":
+        chaos_factor = request.get("cf", oracle.chaos_factor.value)
+        if "roll" in request:
+            roll = request["roll"]
+            if type(roll) is not int:
+                raise ValueError(f"roll must be an integer d100, got {roll!r}")
+        elif roll is None:
+            roll = oracle.rng.randint(1, 100)
+        result = fate_chart.resolve(request.get("odds", "50/50"), chaos_factor, roll)
+        response = {"roll": roll, "answer": fate_chart.ANSWERS[result]}
+        if triggers_random_event(roll, chaos_factor):
+            response["random_event"] = event_json(oracle.random_event())
+        return response
+    if op == "meaning":
+        pairs = oracle.meaning(request.get("table", "Actions"), request.get("count", 1))
+        return {"meaning": [list(pair) for pair in pairs]}
+    if op == "event":
+        return {"random_event": event_json(oracle.random_event())}
+    if op == "end_scene":
+        return {"chaos_factor": oracle.end_scene(bool(request.get("in_control")))}
+    raise ValueError(f"Unknown op: {op!r}")
+
+
+def process_chunk(lines, oracle, fate_rng, first_line_number):
+    """Handles a chunk of input lines and returns the output text for all of them."""
+    decode = _DECODER.decode
+    rolls = fate_rng.choices(D100, k=len(lines))  # Fate question rolls for the whole chunk in one call
+    output = []
+    for i, line in enumerate(lines):
+        if not line.strip():
+            continue
+        try:
+            request = decode(line)
+            response = handle_request(request, oracle, rolls[i])
+            if "id" in request:
+                response = {"id": request["id"], **response}
+        except Exception as e:
+            response = {"line": first_line_number + i, "error": str(e)}
+        output.append(encode_response(response))
+    output.append("")  # Trailing newline
+    return "\n".join(output)
+
+
+def run(infile, outfile, oracle, fate_rng, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Streams infile to outfile chunk by chunk, so memory use does not grow with the input; returns the line count.
+
+    Line n's fate question, if any, rolls the nth d100 of fate_rng.
+    """
+    line_number = 1
+    while chunk := list(islice(infile, chunk_size)):
+        outfile.write(process_chunk(chunk, oracle, fate_rng, line_number))
+        line_number += len(chunk)
+    outfile.flush()
+    return line_number - 1
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Resolve Mythic oracle requests from JSONL.")
+    parser.add_argument("input", nargs="?", default="-", help="JSONL file to read, - for stdin (default)")
+    parser.add_argument("--seed", type=int, default=None, help="seed for reproducible results")
+    parser.add_argument("--chaos-factor", type=int, default=None, help="starting chaos factor (default 5)")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE, help="lines handled per batch")
+    args = parser.parse_args(argv)
+
+    root = StreamRandom(args.seed)
+    try:
+        oracle = Oracle(chaos_factor=args.chaos_factor, rng=root.stream(ORACLE_STREAM))
+    except ValueError as e:
+        parser.error(str(e))
+    fate_rng = root.stream(FATE_ROLL_STREAM)
+    if args.input == "-":
+        run(sys.stdin, sys.stdout, oracle, fate_rng, args.chunk_size)
+    else:
+        with open(args.input, encoding="utf-8") as infile:
+            run(infile, sys.stdout, oracle, fate_rng, args.chunk_size)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+MIN_CHAOS_FACTOR = 1
+MAX_CHAOS_FACTOR = 9
+DEFAULT_CHAOS_FACTOR = 5
+
+
+class ChaosFactor:
+    """The chaos factor of an adventure (the Fate Chart column, 1-9), adjusted at the end of each scene.
+
+    Like the fate chart, it raises ValueError for a value outside 1-9; only the end of scene
+    adjustments stop at the limits.
+    """
+    # Mutable and compared by value, so not hashable; key dicts and Counters on int(chaos_factor)
+    __hash__ = None
+
+    def __init__(self, value=DEFAULT_CHAOS_FACTOR):
+        self.value = self.validate(value)
+
+    def __int__(self):
+        return self.value
+
+    def __eq__(self, other):
+        return int(self) == int(other) if isinstance(other, (ChaosFactor, int)) else NotImplemented
+
+    def __repr__(self):
+        return f"ChaosFactor({self.value})"
+
+    @staticmethod
+    def validate(value):
+        """Returns value if it is a chaos factor, raising ValueError otherwise."""
+        if not isinstance(value, int) or isinstance(value, bool) or not MIN_CHAOS_FACTOR <= value <= MAX_CHAOS_FACTOR:
+            raise ValueError(f"Chaos factor must be between 1 and 9, got {value!r}")
+        return value
+
+    @staticmethod
+    def clamp(value):
+        return max(MIN_CHAOS_FACTOR, min(MAX_CHAOS_FACTOR, value))
+
+    def increase(self):
+        self.value = self.clamp(self.value + 1)
+        return self.value
+
+    def decrease(self):
+        self.value = self.clamp(self.value - 1)
+        return self.value
+
+    def end_scene(self, in_control):
+        """Lowers the chaos factor if the characters were in control of the scene, raises it otherwise."""
+        return self.decrease() if in_control else self.increase()
@@ -0,0 +1,59 @@
+from collections import namedtuple
+from utils.oracles import fate_chart
+from utils.oracles.event_focus import FOCUS_SLOTS
+from utils.oracles.meaning import roll_meaning
+from utils.static_data.table_registry import TABLES_REGISTRY
+from .chaos import ChaosFactor
+from .rng import StreamRandom
+
+
+FateAnswer = namedtuple("FateAnswer", "odds chaos_factor roll result answer random_event")
+RandomEvent = namedtuple("RandomEvent", "focus_roll focus meaning")
+
+# Meaning table rolled for a random event's subject
+EVENT_MEANING_TABLE = "Actions"
+
+
+def triggers_random_event(roll, chaos_factor):
+    """Returns True if a fate question roll is a double (11, 22 ... 99) whose digit is within the chaos factor."""
+    return roll < 100 and roll % 11 == 0 and roll // 11 <= int(chaos_factor)
+
+
+class Oracle:
+    """Headless Mythic oracle: fate questions, random events and meaning rolls around a chaos factor.
+
+    Pure Python on top of utils.oracles and the lazy TABLES_REGISTRY, so it can run without Qt or a
+    database. Every roll comes from `rng`, a random.Random (or compatible) instance such as a story's
+    StreamRandom; pass `seed` instead for a private, reproducible stream.
+    """
+    def __init__(self, chaos_factor=None, rng=None, seed=None):
+        if not isinstance(chaos_factor, ChaosFactor):
+            chaos_factor = ChaosFactor() if chaos_factor is None else ChaosFactor(chaos_factor)
+        self.chaos_factor = chaos_factor
+        self.rng = rng if rng is not None else StreamRandom(seed)
+
+    def ask(self, odds="50/50"):
+        """Asks a fate question at the current chaos factor, rolling a random event on doubles."""
+        chaos_factor = int(self.chaos_factor)
+        roll = self.rng.randint(1, 100)
+        result = fate_chart.resolve(odds, chaos_factor, roll)
+        event = self.random_event() if triggers_random_event(roll, chaos_factor) else None
+        return FateAnswer(odds, chaos_factor, roll, result, fate_chart.answer(result), event)
+
+    def random_event(self, meaning_table=EVENT_MEANING_TABLE):
+        """Rolls an event focus and a meaning pair for it."""
+        focus_roll = self.rng.randint(1, 100)
+        return RandomEvent(focus_roll, FOCUS_SLOTS[focus_roll - 1], self.meaning(meaning_table)[0])
+
+    def meaning(self, table_name="Actions", count=1):
+        """Returns count (word, word) pairs from a meaning table or one of PAIRED_TABLES."""
+        return roll_meaning(table_name, count, rng=self.rng)
+
+    def end_scene(self, in_control):
+        """Adjusts the chaos factor for the next scene and returns its new value."""
+        return self.chaos_factor.end_scene(in_control)
+
+    @staticmethod
+    def table(name):
+        """Returns a table by name, importing its page only on first use."""
+        return TABLES_REGISTRY[name]
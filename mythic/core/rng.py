@@ -0,0 +1,102 @@
+import base64
+import hashlib
+import json
+import random
+import secrets
+import struct
+
+
+D100 = range(1, 101)
+
+# Mersenne Twister state: 624 words plus the position in them
+_MT_STATE = struct.Struct("<625I")
+STATE_VERSION = 1
+
+
+def seed_entropy(seed):
+    """Returns the integer root entropy for a seed; str, bytes and float seeds are hashed into one.
+
+    These are the seed types random.Random takes besides int and None.
+    """
+    if isinstance(seed, int):
+        return seed
+    if isinstance(seed, float):
+        seed = seed.hex()
+    if isinstance(seed, str):
+        seed = seed.encode()
+    if not isinstance(seed, (bytes, bytearray)):
+        raise TypeError(f"The seed must be an int, float, str, bytes or bytearray, got {type(seed).__name__}")
+    return int.from_bytes(hashlib.blake2b(seed, digest_size=16, person=b"mythic-seed").digest(), "little")
+
+
+def derive_seed(entropy, spawn_key):
+    """Hashes root entropy and a spawn key into a 256-bit generator seed.
+
+    Keys that differ anywhere give unrelated seeds, so sibling and nested streams never overlap in practice.
+    """
+    digest = hashlib.blake2b(digest_size=32, person=b"mythic-rng")
+    digest.update(str(entropy).encode())
+    for part in spawn_key:
+        digest.update(b"/" + str(int(part)).encode())
+    return int.from_bytes(digest.digest(), "little")
+
+
+class StreamRandom(random.Random):
+    """A random.Random stream identified by root entropy and a spawn key, SeedSequence style.
+
+    StreamRandom(seed, (3,)) is always the same stream, however much any other stream has been used,
+    so campaigns, stories or workers can each own one without sharing a generator or a lock. spawn()
+    hands out child streams under this one's key. The full state, position included, round-trips
+    through to_state()/from_state() for replays.
+    """
+    def __init__(self, seed=None, spawn_key=()):
+        self.entropy = secrets.randbits(128) if seed is None else seed_entropy(seed)
+        self.spawn_key = tuple(int(part) for part in spawn_key)
+        self.children_spawned = 0
+        super().__init__(derive_seed(self.entropy, self.spawn_key))
+
+    def __repr__(self):
+        return f"StreamRandom({self.entropy}, {self.spawn_key})"
+
+    def __reduce__(self):
+        # random.Random pickles as a bare constructor call plus the twister state, which would give
+        # a copy new entropy and an empty spawn key; carry the whole identity instead
+        return type(self).from_state, (self.to_state(),)
+
+    def stream(self, *key):
+        """Returns the child stream at spawn key key, without counting it as spawned."""
+        return StreamRandom(self.entropy, self.spawn_key + key)
+
+    def spawn(self, n=1):
+        """Returns n new child streams; later calls continue after the ones already handed out."""
+        first = self.children_spawned
+        self.children_spawned += n
+        return [self.stream(i) for i in range(first, first + n)]
+
+    def d100(self, n=1):
+        """Returns n d100 rolls from a single call."""
+        return self.choices(D100, k=n)
+
+    def to_state(self):
+        """Returns the stream's identity and exact position as a JSON string."""
+        version, words, gauss_next = self.getstate()
+        return json.dumps({
+            "version": STATE_VERSION,
+            "entropy": self.entropy,
+            "spawn_key": self.spawn_key,
+            "children_spawned": self.children_spawned,
+            "mt": base64.b64encode(_MT_STATE.pack(*words)).decode("ascii"),
+            "gauss_next": gauss_next,
+        })
+
+    @classmethod
+    def from_state(cls, state):
+        """Rebuilds a stream saved with to_state(), continuing exactly where it stopped."""
+        data = json.loads(state)
+        if data.get("version") != STATE_VERSION:
+            raise ValueError(f"Unsupported RNG state version: {data.get('version')!r}")
+        rng = cls(data["entropy"], data["spawn_key"])
+        rng.children_spawned = data["children_spawned"]
+        words = _MT_STATE.unpack(base64.b64decode(data["mt"]))
+        rng.setstate((random.Random.VERSION, words, data["gauss_next"]))
+        return rng
@@ -0,0 +1,229 @@
+"""Monte Carlo campaign simulator for tuning chaos factor and thread house rules, without Qt.
+
+Run from the mythic directory:
+
+    python -m core.simulator [--campaigns N] [--scenes N] [--questions N] [--seed N] [--workers N]
+
+Each campaign plays a run of scenes. A scene opens with the scene test (d10 against the chaos
+factor: odd altered, even interrupted), asks fate questions on the FATE_CHART, fires a random
+event on doubles within the chaos factor, and ends with the chaos factor adjustment. Random
+events roll on the RANDOM_EVENT_FOCUS_TABLE; thread foci move a random open thread toward or
+away from its closure.
+
+Campaign n plays on the StreamRandom stream with spawn key (n,) under the seed, so results depend
+only on the seed and rules, never on how campaigns are split across worker processes.
+"""
+import argparse
+import os
+from collections import Counter, namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from utils.oracles import fate_chart
+from utils.oracles.event_focus import FOCUS_SLOTS
+from .chaos import ChaosFactor, DEFAULT_CHAOS_FACTOR
+from .oracle import triggers_random_event
+from .rng import StreamRandom
+
+
+Rules = namedtuple(
+    "Rules",
+    "scenes questions_per_scene odds chaos_factor starting_threads thread_progress",
+    defaults=(20, 6, ("likely", "50/50", "unlikely"), DEFAULT_CHAOS_FACTOR, 3, 3),
+)
+Rules.__doc__ = """Campaign rules: odds are picked uniformly per question; a thread closes after
+thread_progress 'Move Toward A Thread' events or at once on 'Close A Thread'."""
+
+EXPECTED, ALTERED, INTERRUPTED = "expected", "altered", "interrupted"
+MOVE_TOWARD, MOVE_AWAY, CLOSE = "Move Toward A Thread", "Move Away From A Thread", "Close A Thread"
+D100 = range(1, 101)
+CF_COUNT = len(fate_chart.CHAOS_FACTORS)
+
+# Campaigns per task handed to a worker, as a multiple of the worker count
+BATCHES_PER_WORKER = 4
+
+
+class SimulationStats:
+    """Distributions gathered over simulated campaigns; stats from separate batches merge by addition."""
+    def __init__(self):
+        self.campaigns = 0
+        self.scenes = 0
+        self.events_per_scene = Counter()  # Random events in a scene (interrupts included) -> scenes
+        self.scene_types = Counter()
+        self.chaos_factor = Counter()      # Chaos factor at the start of a scene -> scenes
+        self.results = Counter()           # Fate result code -> questions
+        self.focus = Counter()
+        self.thread_closure = Counter()    # Scenes from campaign start to a thread's closure -> threads
+        self.open_threads = 0              # Threads still open when their campaign ended
+
+    def merge(self, other):
+        self.campaigns += other.campaigns
+        self.scenes += other.scenes
+        self.open_threads += other.open_threads
+        for name in ("events_per_scene", "scene_types", "chaos_factor", "results", "focus", "thread_closure"):
+            getattr(self, name).update(getattr(other, name))
+        return self
+
+    def exceptional_rates(self):
+        """Returns the share of questions answered exceptional yes and exceptional no."""
+        questions = sum(self.results.values()) or 1
+        return (self.results[fate_chart.EXCEPTIONAL_YES] / questions,
+                self.results[fate_chart.EXCEPTIONAL_NO] / questions)
+
+    def mean_events_per_scene(self):
+        return sum(n * count for n, count in self.events_per_scene.items()) / (self.scenes or 1)
+
+    def mean_thread_closure(self):
+        """Returns the mean scene count to close a thread, over threads that closed, or None."""
+        closed = sum(self.thread_closure.values())
+        return sum(n * count for n, count in self.thread_closure.items()) / closed if closed else None
+
+
+_OUTCOME_ROWS = {}
+
+
+def outcome_rows(odds):
+    """Returns the result code of every d100 roll for each (odds, chaos factor) pair, odds-major."""
+    rows = _OUTCOME_ROWS.get(odds)
+    if rows is None:
+        rows = _OUTCOME_ROWS[odds] = [
+            bytes(fate_chart.resolve_many((label, cf, roll) for roll in D100))
+            for label in odds for cf in fate_chart.CHAOS_FACTORS
+        ]
+    return rows
+
+
+def campaign_rng(seed, campaign):
+    """Returns the independent stream of one campaign."""
+    return StreamRandom(seed, (campaign,))
+
+
+def play_campaign(rules, rng, stats):
+    """Plays one campaign with rng and adds it to stats."""
+    chaos_factor = ChaosFactor(rules.chaos_factor)
+    threads = [0] * rules.starting_threads  # Progress of each open thread
+    outcomes = outcome_rows(rules.odds)
+    odds_count = len(rules.odds)
+    results = stats.results
+    focus_counts = stats.focus
+
+    for scene in range(1, rules.scenes + 1):
+        cf = chaos_factor.value
+        stats.chaos_factor[cf] += 1
+        events = []
+        scene_roll = rng.randint(1, 10)
+        if scene_roll > cf:
+            scene_type = EXPECTED
+        elif scene_roll % 2:
+            scene_type = ALTERED
+        else:
+            scene_type = INTERRUPTED
+            events.append(rng.choice(FOCUS_SLOTS))
+        stats.scene_types[scene_type] += 1
+
+        # Both the odds and the d100 of every question in the scene come from one call each
+        questions = rules.questions_per_scene
+        odds_rows = rng.choices(range(odds_count), k=questions)
+        rolls = rng.d100(questions)
+        yeses = 0
+        for row, roll in zip(odds_rows, rolls):
+            result = outcomes[row * CF_COUNT + cf - 1][roll - 1]
+            results[result] += 1
+            if result <= fate_chart.EXCEPTIONAL_YES:
+                yeses += 1
+            if triggers_random_event(roll, cf):
+                events.append(FOCUS_SLOTS[rng.randint(1, 100) - 1])
+
+        for focus in events:
+            focus_counts[focus] += 1
+            if not threads or focus not in (MOVE_TOWARD, MOVE_AWAY, CLOSE):
+                continue
+            i = rng.randrange(len(threads))
+            if focus == MOVE_AWAY:
+                threads[i] = max(0, threads[i] - 1)
+                continue
+            threads[i] += 1
+            if focus == CLOSE or threads[i] >= rules.thread_progress:
+                threads.pop(i)
+                stats.thread_closure[scene] += 1
+        stats.events_per_scene[len(events)] += 1
+
+        # The characters were in control unless the scene was interrupted or went mostly against them
+        chaos_factor.end_scene(scene_type != INTERRUPTED and 2 * yeses >= questions)
+
+    stats.campaigns += 1
+    stats.scenes += rules.scenes
+    stats.open_threads += len(threads)
+    return stats
+
+
+def simulate_range(rules, seed, first, last):
+    """Plays campaigns first..last - 1 and returns their stats; the unit of work of a worker."""
+    stats = SimulationStats()
+    for campaign in range(first, last):
+        play_campaign(rules, campaign_rng(seed, campaign), stats)
+    return stats
+
+
+def simulate(campaigns, rules=Rules(), seed=0, workers=None):
+    """Plays campaigns on a pool of worker processes (os.cpu_count() by default) and returns the merged stats.
+
+    workers=1 runs in this process.
+    """
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        return simulate_range(rules, seed, 0, campaigns)
+    batch = max(1, -(-campaigns // (workers * BATCHES_PER_WORKER)))
+    starts = range(0, campaigns, batch)
+    stats = SimulationStats()
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for batch_stats in executor.map(
+            simulate_range, [rules] * len(starts), [seed] * len(starts),
+            starts, [min(first + batch, campaigns) for first in starts],
+        ):
+            stats.merge(batch_stats)
+    return stats
+
+
+def format_stats(stats):
+    """Returns a plain text report of the stats."""
+    exceptional_yes, exceptional_no = stats.exceptional_rates()
+    mean_closure = stats.mean_thread_closure()
+    closed = sum(stats.thread_closure.values())
+    lines = [
+        f"campaigns: {stats.campaigns}  scenes: {stats.scenes}",
+        f"events per scene: mean {stats.mean_events_per_scene():.3f}  "
+        + "  ".join(f"{n}: {count / stats.scenes:.3f}" for n, count in sorted(stats.events_per_scene.items())),
+        "scene types: " + "  ".join(f"{name} {count / stats.scenes:.3f}" for name, count in stats.scene_types.most_common()),
+        "chaos factor: " + "  ".join(f"{cf}: {count / stats.scenes:.3f}" for cf, count in sorted(stats.chaos_factor.items())),
+        f"exceptional yes: {exceptional_yes:.4f}  exceptional no: {exceptional_no:.4f}",
+        f"threads closed: {closed}  still open: {stats.open_threads}  "
+        + (f"mean scenes to close: {mean_closure:.2f}" if mean_closure is not None else ""),
+    ]
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    defaults = Rules()
+    parser = argparse.ArgumentParser(description="Simulate Mythic campaigns and report chaos factor and event distributions.")
+    parser.add_argument("--campaigns", type=int, default=10000)
+    parser.add_argument("--scenes", type=int, default=defaults.scenes, help="scenes per campaign")
+    parser.add_argument("--questions", type=int, default=defaults.questions_per_scene, help="fate questions per scene")
+    parser.add_argument("--odds", nargs="+", default=list(defaults.odds), help="odds picked from for each question")
+    parser.add_argument("--chaos-factor", type=int, default=defaults.chaos_factor, help="starting chaos factor")
+    parser.add_argument("--threads", type=int, default=defaults.starting_threads, help="open threads at the start")
+    parser.add_argument("--thread-progress", type=int, default=defaults.thread_progress,
+                        help="'Move Toward A Thread' events that close a thread")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: one per CPU)")
+    args = parser.parse_args(argv)
+
+    try:
+        odds = tuple(fate_chart.ODDS[fate_chart.odds_index(odds)] for odds in args.odds)
+        ChaosFactor.validate(args.chaos_factor)
+    except ValueError as e:
+        parser.error(str(e))
+    rules = Rules(args.scenes, args.questions, odds, args.chaos_factor, args.threads, args.thread_progress)
+    print(format_stats(simulate(args.campaigns, rules, args.seed, args.workers)))
+
+
+if __name__ == "__main__":
+    main()
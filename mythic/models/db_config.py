@@ -1,14 +1,88 @@
-from sqlalchemy import create_engine
+import os
+from dataclasses import dataclass, fields, replace
+from sqlalchemy import create_engine, event
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import sessionmaker
-from sqlalchemy import inspect
+from sqlalchemy import inspect, text
 
 
 
 DATABASE_URL = "sqlite:///mythic_stories.db"
-# engine = create_engine(DATABASE_URL, echo=True)
-engine = create_engine(DATABASE_URL, echo=False)
+
+JOURNAL_MODES = {"DELETE", "TRUNCATE", "PERSIST", "MEMORY", "WAL", "OFF"}
+SYNCHRONOUS_LEVELS = {"OFF", "NORMAL", "FULL", "EXTRA"}
+
+
+@dataclass(frozen=True)
+class SQLiteSettings:
+    """Pragmas applied to every new SQLite connection. None leaves SQLite's own default in place.
+
+    WAL needs shared memory between processes, so installs on network drives should use
+    journal_mode="TRUNCATE" and keep synchronous="NORMAL" for most of the fsync savings.
+    """
+    journal_mode: str | None = "WAL"
+    synchronous: str | None = "NORMAL"
+    cache_size: int | None = -64000  # Negative values are KiB, i.e. a 64 MB page cache
+    mmap_size: int | None = 256 * 1024 * 1024
+
+    def __post_init__(self):
+        if self.journal_mode is not None and self.journal_mode.upper() not in JOURNAL_MODES:
+            raise ValueError(f"Unsupported journal_mode: {self.journal_mode}")
+        if self.synchronous is not None and self.synchronous.upper() not in SYNCHRONOUS_LEVELS:
+            raise ValueError(f"Unsupported synchronous level: {self.synchronous}")
+
+    def pragmas(self):
+        """Returns the (pragma, value) pairs to execute, skipping unset ones."""
+        return [(field.name, getattr(self, field.name)) for field in fields(self) if getattr(self, field.name) is not None]
+
+    @classmethod
+    def from_env(cls, environ=os.environ):
+        """Builds settings from MYTHIC_DB_PROFILE plus per-pragma MYTHIC_DB_<PRAGMA> overrides.
+
+        An override of "default" unsets that pragma, e.g. MYTHIC_DB_JOURNAL_MODE=default.
+        """
+        profile = environ.get("MYTHIC_DB_PROFILE", "tuned").lower()
+        if profile not in SQLITE_PROFILES:
+            raise ValueError(f"Unknown MYTHIC_DB_PROFILE: {profile}")
+        overrides = {}
+        for field in fields(cls):
+            value = environ.get(f"MYTHIC_DB_{field.name.upper()}")
+            if value is None:
+                continue
+            if value.lower() == "default":
+                overrides[field.name] = None
+            elif field.name in ("cache_size", "mmap_size"):
+                overrides[field.name] = int(value)
+            else:
+                overrides[field.name] = value
+        return replace(SQLITE_PROFILES[profile], **overrides)
+
+
+SQLITE_PROFILES = {
+    "tuned": SQLiteSettings(),
+    "default": SQLiteSettings(journal_mode=None, synchronous=None, cache_size=None, mmap_size=None),
+}
+
+
+def create_sqlite_engine(url=DATABASE_URL, settings=None, echo=False):
+    """Creates an engine that applies the given SQLiteSettings (from env if None) on every connect."""
+    settings = settings if settings is not None else SQLiteSettings.from_env()
+    sqlite_engine = create_engine(url, echo=echo)
+    pragmas = settings.pragmas()
+
+    @event.listens_for(sqlite_engine, "connect")
+    def apply_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for pragma, value in pragmas:
+            cursor.execute(f"PRAGMA {pragma}={value}")
+        cursor.close()
+
+    return sqlite_engine
+
+
+# engine = create_sqlite_engine(DATABASE_URL, echo=True)
+engine = create_sqlite_engine(DATABASE_URL, echo=False)
 
 Base = declarative_base()  # Defined centrally
 
@@ -20,9 +94,13 @@ session = SessionLocal()
 def initialize_db():
     """Creates the database and populates specific tables if missing."""
     from .master_tables import StoriesIndex, Characters, Places, Items, Threads, Notes
+    from .story_tables import StoryListRows, STORY_LIST_STORAGE, migrate_dynamic_story_lists
+    from .image_store import StoredImages, ImageRefs, migrate_legacy_images
+    from .notes_search import create_notes_fts
+    from .story_rng import migrate_story_rngs
     inspector = inspect(engine)
     
-    models = [StoriesIndex, Characters, Places, Items, Threads, Notes]  # List all models
+    models = [StoriesIndex, Characters, Places, Items, Threads, Notes, StoryListRows, StoredImages, ImageRefs]  # List all models
 
     try:
         for model in models:
@@ -35,7 +113,33 @@ def initialize_db():
                         story = StoriesIndex(index=i, name=None, description=None)
                         session.add(story)
                     session.commit()
+        add_missing_columns(models)
+        create_missing_indexes(models)
+        create_notes_fts(engine)
+        if STORY_LIST_STORAGE == "partitioned":
+            migrate_dynamic_story_lists(engine)
+        migrate_legacy_images(session)
+        migrate_story_rngs(session)
     except IntegrityError:
         session.rollback()
     finally:
         session.close()
+
+
+def add_missing_columns(models):
+    """Adds nullable columns declared on the models that an existing database file does not have yet."""
+    inspector = inspect(engine)
+    with engine.begin() as connection:
+        for model in models:
+            existing = {column["name"] for column in inspector.get_columns(model.__tablename__)}
+            for column in model.__table__.columns:
+                if column.name not in existing and column.nullable:
+                    column_type = column.type.compile(engine.dialect)
+                    connection.execute(text(f'ALTER TABLE "{model.__tablename__}" ADD COLUMN "{column.name}" {column_type}'))
+
+
+def create_missing_indexes(models):
+    """Creates any index declared on the models that an existing database file does not have yet."""
+    for model in models:
+        for index in model.__table__.indexes:
+            index.create(engine, checkfirst=True)
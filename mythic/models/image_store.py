@@ -0,0 +1,129 @@
+import hashlib
+import os
+from sqlalchemy import Column, Integer, String, Index, func
+from .db_config import Base  # Import shared Base
+
+
+class StoredImages(Base):
+    """One row per file in the content-addressed image store, with the number of entries using it."""
+    __tablename__ = "stored_images"
+
+    digest = Column(String, primary_key=True)  # sha256 of the stored file
+    path = Column(String, nullable=False)
+    ref_count = Column(Integer, nullable=False, default=0)
+
+class ImageRefs(Base):
+    """Which character, place or item uses which stored image."""
+    __tablename__ = "image_refs"
+    __table_args__ = (
+        Index("ix_image_refs_type_type_id", "type", "type_id", unique=True),
+        Index("ix_image_refs_story_index", "story_index"),
+    )
+
+    id = Column(Integer, primary_key=True)
+    type = Column(String, nullable=False)  # "characters", "places" or "items"
+    type_id = Column(Integer, nullable=False)
+    story_index = Column(Integer, nullable=True)
+    digest = Column(String, nullable=False)
+
+
+def _release_digests(session, digest_counts):
+    """Decrements ref counts and drops images nobody uses any more; returns their paths."""
+    orphaned_paths = []
+    for digest, count in digest_counts:
+        stored = session.get(StoredImages, digest)
+        if stored is None:
+            continue
+        stored.ref_count -= count
+        if stored.ref_count <= 0:
+            orphaned_paths.append(stored.path)
+            session.delete(stored)
+    return orphaned_paths
+
+
+def release_image_ref(session, nav_type, nav_id):
+    """Drops the image reference of one entry; returns the paths of files left unreferenced."""
+    ref = session.query(ImageRefs).filter(ImageRefs.type == nav_type, ImageRefs.type_id == nav_id).first()
+    if ref is None:
+        return []
+    session.delete(ref)
+    return _release_digests(session, [(ref.digest, 1)])
+
+
+def set_image_ref(session, nav_type, nav_id, story_index, digest, path):
+    """Points an entry at a stored image, releasing the one it used before; returns unreferenced paths."""
+    ref = session.query(ImageRefs).filter(ImageRefs.type == nav_type, ImageRefs.type_id == nav_id).first()
+    if ref is not None and ref.digest == digest:
+        return []
+    orphaned_paths = release_image_ref(session, nav_type, nav_id)
+    session.flush()  # The unique (type, type_id) row must be gone before adding the new one
+
+    stored = session.get(StoredImages, digest)
+    if stored is None:
+        stored = StoredImages(digest=digest, path=path, ref_count=0)
+        session.add(stored)
+    stored.ref_count += 1
+    session.add(ImageRefs(type=nav_type, type_id=nav_id, story_index=story_index, digest=digest))
+    return orphaned_paths
+
+
+def stored_image_path(session, digest):
+    """Returns the store path recorded for an image, or None if it is not in the store."""
+    stored = session.get(StoredImages, digest)
+    return stored.path if stored is not None else None
+
+
+def release_story_images(session, story_index):
+    """Drops every image reference held by a story; returns the paths of files left unreferenced."""
+    refs = ImageRefs.story_index == story_index
+    digest_counts = session.query(ImageRefs.digest, func.count()).filter(refs).group_by(ImageRefs.digest).all()
+    session.query(ImageRefs).filter(refs).delete(synchronize_session=False)
+    return _release_digests(session, digest_counts)
+
+
+def remove_image_files(paths):
+    """Deletes stored image files (and their thumbnails); call after the releasing commit succeeded."""
+    from utils.thumbnails import remove_thumbnails
+
+    for path in paths:
+        try:
+            os.remove(path)
+            remove_thumbnails(path)
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            print(f"Failed to remove {path}: {e}")
+
+
+def migrate_legacy_images(session):
+    """Moves images saved as visuals/<type>/<id>_<label><ext> into the store and references them."""
+    from .master_tables import Characters, Places, Items
+    from utils.image_import import STORE_DIR, content_path, image_extension
+    from utils.thumbnails import remove_thumbnails
+
+    orphaned_paths = []
+    for nav_type, model in (("characters", Characters), ("places", Places), ("items", Items)):
+        legacy_rows = session.query(model).filter(
+            model.image_path.isnot(None),
+            ~model.image_path.startswith(STORE_DIR)
+        ).all()
+        for row in legacy_rows:
+            if not os.path.exists(row.image_path):
+                row.image_path = None
+                continue
+            with open(row.image_path, "rb") as f:
+                digest = hashlib.file_digest(f, "sha256").hexdigest()
+            store_path = content_path(digest, image_extension(row.image_path))
+            remove_thumbnails(row.image_path)
+            if os.path.exists(store_path):
+                os.remove(row.image_path)
+            else:
+                os.makedirs(os.path.dirname(store_path), exist_ok=True)
+                os.replace(row.image_path, store_path)
+            orphaned_paths += set_image_ref(session, nav_type, row.id, row.story_index, digest, store_path)
+            # The digest's row may already point at a file stored under another name; that one is kept
+            row.image_path = stored_image_path(session, digest)
+            if row.image_path != store_path:
+                orphaned_paths.append(store_path)
+    session.commit()
+    remove_image_files(orphaned_paths)
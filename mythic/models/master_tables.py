@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, Boolean
+from sqlalchemy import Column, Integer, String, Text, DateTime, Boolean, Index
 from datetime import datetime
 from zoneinfo import ZoneInfo
 from .db_config import Base  # Import shared Base
@@ -14,9 +14,14 @@ class StoriesIndex(Base):
     description = Column(Text, nullable=True)
     created_date = Column(DateTime, default=lambda: datetime.now().replace(tzinfo=IST))
     modified_date = Column(DateTime, default=lambda: datetime.now().replace(tzinfo=IST), onupdate=lambda: datetime.now().replace(tzinfo=IST))
+    rng_state = Column(Text, nullable=True)  # The story's dice stream, see models/story_rng.py
 
 class Characters(Base):
     __tablename__ = "characters"
+    __table_args__ = (
+        Index("ix_characters_story_index_active_name", "story_index", "active", "name"),
+        Index("ix_characters_name", "name"),
+    )
 
     id = Column(Integer, primary_key=True)
     name = Column(String, nullable=True)
@@ -33,6 +38,10 @@ class Characters(Base):
 
 class Places(Base):
     __tablename__ = "places"
+    __table_args__ = (
+        Index("ix_places_story_index_active_name", "story_index", "active", "name"),
+        Index("ix_places_name", "name"),
+    )
 
     id = Column(Integer, primary_key=True)
     name = Column(String, nullable=True)
@@ -46,6 +55,10 @@ class Places(Base):
 
 class Items(Base):
     __tablename__ = "items"
+    __table_args__ = (
+        Index("ix_items_story_index_active_name", "story_index", "active", "name"),
+        Index("ix_items_name", "name"),
+    )
 
     id = Column(Integer, primary_key=True)
     name = Column(String, nullable=True)
@@ -59,6 +72,7 @@ class Items(Base):
 
 class Threads(Base):
     __tablename__ = "threads"
+    __table_args__ = (Index("ix_threads_story_index_active", "story_index", "active"),)
 
     id = Column(Integer, primary_key=True)
     thread = Column(String, nullable=True)   
@@ -70,6 +84,7 @@ class Threads(Base):
 
 class Notes(Base):
     __tablename__ = "notes"
+    __table_args__ = (Index("ix_notes_type_type_id", "type", "type_id"),)
 
     id = Column(Integer, primary_key=True)
     type = Column(String, nullable=True)
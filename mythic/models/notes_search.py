@@ -0,0 +1,107 @@
+from html.parser import HTMLParser
+from sqlalchemy import inspect, text
+
+
+# Plain text of every note for full-text search; the FTS rowid is the Notes.id it was taken from
+NOTES_FTS_TABLE = "notes_fts"
+
+
+class _TextExtractor(HTMLParser):
+    """Collects the visible text of an HTML document, one line per block element."""
+    BLOCK_TAGS = {"p", "br", "div", "li", "tr", "h1", "h2", "h3", "h4", "h5", "h6"}
+    SKIPPED_TAGS = {"head", "style", "script"}
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.parts = []
+        self.skipping = 0
+
+    def handle_starttag(self, tag, attrs):
+        if tag in self.SKIPPED_TAGS:
+            self.skipping += 1
+        elif tag in self.BLOCK_TAGS:
+            self.parts.append("\n")
+
+    def handle_endtag(self, tag):
+        if tag in self.SKIPPED_TAGS:
+            self.skipping = max(0, self.skipping - 1)
+
+    def handle_data(self, data):
+        if not self.skipping:
+            self.parts.append(data)
+
+
+def html_to_text(html):
+    """Returns the plain text of a note saved from QTextEdit.toHtml()."""
+    if not html:
+        return ""
+    extractor = _TextExtractor()
+    extractor.feed(html)
+    extractor.close()
+    lines = (" ".join(line.split()) for line in "".join(extractor.parts).splitlines())
+    return "\n".join(line for line in lines if line)
+
+
+def create_notes_fts(engine):
+    """Creates the notes_fts table if missing and fills it from the existing notes."""
+    if inspect(engine).has_table(NOTES_FTS_TABLE):
+        return
+    with engine.begin() as connection:
+        connection.execute(text(
+            f"CREATE VIRTUAL TABLE {NOTES_FTS_TABLE} USING fts5("
+            "body, type UNINDEXED, type_id UNINDEXED, story_index UNINDEXED, "
+            "tokenize = 'unicode61 remove_diacritics 2', prefix = '2 3')"  # Short prefixes get their own index
+        ))
+        notes = connection.execute(text(
+            "SELECT id, type, type_id, story_index, notes FROM notes WHERE notes IS NOT NULL AND notes != ''"
+        )).all()
+        rows = [
+            {"id": note_id, "body": html_to_text(html), "type": note_type, "type_id": type_id, "story_index": story_index}
+            for note_id, note_type, type_id, story_index, html in notes
+        ]
+        if rows:
+            connection.execute(text(
+                f"INSERT INTO {NOTES_FTS_TABLE} (rowid, body, type, type_id, story_index) "
+                "VALUES (:id, :body, :type, :type_id, :story_index)"
+            ), rows)
+
+
+def index_note_text(session, note):
+    """Replaces the searchable text of a Notes row; call whenever its notes are saved."""
+    session.execute(text(f"DELETE FROM {NOTES_FTS_TABLE} WHERE rowid = :id"), {"id": note.id})
+    body = html_to_text(note.notes)
+    if body:
+        session.execute(text(
+            f"INSERT INTO {NOTES_FTS_TABLE} (rowid, body, type, type_id, story_index) "
+            "VALUES (:id, :body, :type, :type_id, :story_index)"
+        ), {"id": note.id, "body": body, "type": note.type, "type_id": note.type_id, "story_index": note.story_index})
+
+
+def remove_story_notes_text(session, story_index):
+    """Drops the searchable text of every note of a story."""
+    session.execute(text(f"DELETE FROM {NOTES_FTS_TABLE} WHERE story_index = :story_index"), {"story_index": story_index})
+
+
+def fts_query(query):
+    """Turns free text into an FTS5 query of quoted words, the last one matched as a prefix.
+
+    Quoting makes operators or quotes typed by the user literal; only the word still being typed
+    is a prefix, as prefix terms cost the most to look up.
+    """
+    words = ['"' + word.replace('"', '""') + '"' for word in query.split()]
+    if words:
+        words[-1] += "*"
+    return " ".join(words)
+
+
+def search_notes(session, story_index, query, limit=20):
+    """Returns (type, type_id, snippet) for the story's notes matching query, best (bm25) first."""
+    match = fts_query(query)
+    if not match:
+        return []
+    rows = session.execute(text(
+        f"SELECT type, type_id, snippet({NOTES_FTS_TABLE}, 0, '[', ']', '...', 12) "
+        f"FROM {NOTES_FTS_TABLE} WHERE {NOTES_FTS_TABLE} MATCH :match AND story_index = :story_index "
+        "ORDER BY rank LIMIT :limit"
+    ), {"match": match, "story_index": story_index, "limit": limit})
+    return [tuple(row) for row in rows]
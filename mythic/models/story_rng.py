@@ -0,0 +1,30 @@
+from core.rng import StreamRandom
+from .master_tables import StoriesIndex
+
+
+def new_story_rng(session, story_index):
+    """Gives a story a fresh dice stream keyed by its index and stores it; the caller commits."""
+    rng = StreamRandom(None, (story_index,))
+    save_story_rng(session, story_index, rng)
+    return rng
+
+
+def load_story_rng(session, story_index):
+    """Returns the story's dice stream where it was last saved."""
+    state = session.query(StoriesIndex.rng_state).filter(StoriesIndex.index == story_index).scalar()
+    if not state:
+        raise ValueError(f"Story {story_index} has no dice stream")
+    return StreamRandom.from_state(state)
+
+
+def save_story_rng(session, story_index, rng):
+    """Stores the stream's position on the story so the next session carries on from it; the caller commits."""
+    session.query(StoriesIndex).filter(StoriesIndex.index == story_index).update({StoriesIndex.rng_state: rng.to_state()})
+
+
+def migrate_story_rngs(session):
+    """Gives every story created before dice streams were stored one of its own."""
+    stories = session.query(StoriesIndex.index).filter(StoriesIndex.name.isnot(None), StoriesIndex.rng_state.is_(None)).all()
+    for (story_index,) in stories:
+        new_story_rng(session, story_index)
+    session.commit()
@@ -1,13 +1,32 @@
-from sqlalchemy import Column, Integer, String
+import os
+import re
+from sqlalchemy import Column, Integer, String, inspect, text
 from .db_config import Base  # Import shared Base
 
 
+# "partitioned" keeps every story's lists in story_list_rows, "dynamic" uses one table per story and list
+STORY_LIST_STORAGE = os.environ.get("MYTHIC_STORY_LIST_STORAGE", "partitioned").lower()
+STORY_LIST_ROWS = 25
+
+DYNAMIC_TABLE_PATTERN = re.compile(r"^(\d+)_(characters|threads)_list$")
+
+
+# Mapped classes already defined by create_dynamic_model, keyed by (mixin, table name); kept
+# when their table is dropped, as a mapped class cannot be taken back out of the registry
+_DYNAMIC_MODELS = {}
+
+
 def create_dynamic_model(model_class, table_name):
-    """ Dynamically assigns a table name to an ORM model """
-    class DynamicModel(Base, model_class):  # Base must come first for proper ORM mapping
-        __tablename__ = table_name
-        __table_args__ = {"extend_existing": True}
-    return DynamicModel
+    """ Dynamically assigns a table name to an ORM model, reusing the class mapped earlier if any """
+    key = (model_class, table_name)
+    if key not in _DYNAMIC_MODELS:
+        # A distinct class name per table keeps the declarative string-lookup registry unambiguous
+        _DYNAMIC_MODELS[key] = type(
+            f"{model_class.__name__}_{table_name}",
+            (Base, model_class),  # Base must come first for proper ORM mapping
+            {"__tablename__": table_name, "__table_args__": {"extend_existing": True}},
+        )
+    return _DYNAMIC_MODELS[key]
 
 class CharactersList:
     row = Column(Integer, primary_key=True)
@@ -18,4 +37,95 @@ class CharactersList:
 class ThreadsList:
     row = Column(Integer, primary_key=True)
     thread = Column(String, nullable=True)
-    master_id = Column(Integer, nullable=True)
\ No newline at end of file
+    master_id = Column(Integer, nullable=True)
+
+class StoryListRows(Base):
+    """All stories' characters and threads lists in one table, clustered on (story_index, list_kind, row)."""
+    __tablename__ = "story_list_rows"
+    __table_args__ = {"sqlite_with_rowid": False}
+
+    story_index = Column(Integer, primary_key=True)
+    list_kind = Column(String, primary_key=True)  # "characters" or "threads"
+    row = Column(Integer, primary_key=True)
+    name = Column(String, nullable=True)
+    type = Column(String, nullable=True)
+    thread = Column(String, nullable=True)
+    master_id = Column(Integer, nullable=True)
+
+
+LIST_MIXINS = {"characters": CharactersList, "threads": ThreadsList}
+EMPTY_ROWS = {"characters": {"name": None, "type": None}, "threads": {"thread": None}}
+
+
+class StoryList:
+    """One story's characters or threads list, stored according to STORY_LIST_STORAGE."""
+    def __init__(self, story_index, list_kind, storage=None):
+        self.story_index = story_index
+        self.list_kind = list_kind
+        self.storage = storage or STORY_LIST_STORAGE
+        if self.storage == "partitioned":
+            self.model = StoryListRows
+            self._scope = (StoryListRows.story_index == story_index, StoryListRows.list_kind == list_kind)
+        else:
+            self.model = create_dynamic_model(LIST_MIXINS[list_kind], f"{story_index}_{list_kind}_list")
+            self._scope = ()
+
+    def query(self, session):
+        """Returns a query over this list's rows only."""
+        return session.query(self.model).filter(*self._scope)
+
+    def create(self, session):
+        """Creates the list with empty rows if it does not exist yet."""
+        if self.storage == "partitioned":
+            if self.query(session).first() is not None:
+                return
+            keys = {"story_index": self.story_index, "list_kind": self.list_kind}
+        else:
+            # DDL goes through the session's connection so it joins the open transaction
+            connection = session.connection()
+            if inspect(connection).has_table(self.model.__tablename__):
+                return
+            self.model.__table__.create(connection)
+            keys = {}
+        session.bulk_insert_mappings(
+            self.model,
+            [{**keys, "row": i, **EMPTY_ROWS[self.list_kind]} for i in range(1, STORY_LIST_ROWS + 1)]
+        )
+
+    def save_row(self, session, row, values):
+        """Updates a row of the list, adding it if the list does not reach that far yet."""
+        if self.query(session).filter(self.model.row == row).update(values, synchronize_session=False):
+            return
+        keys = {"story_index": self.story_index, "list_kind": self.list_kind} if self.storage == "partitioned" else {}
+        session.add(self.model(**keys, row=row, **values))
+
+    def drop(self, session):
+        """Removes the list and all its rows."""
+        if self.storage == "partitioned":
+            self.query(session).delete(synchronize_session=False)
+        else:
+            # The mapped class stays cached, so a list recreated for this slot maps no second class
+            self.model.__table__.drop(session.connection(), checkfirst=True)
+
+
+def migrate_dynamic_story_lists(engine):
+    """Folds any per-story {index}_characters_list / {index}_threads_list tables into story_list_rows."""
+    table = StoryListRows.__table__
+    columns = {column.name for column in table.columns}
+    for table_name in inspect(engine).get_table_names():
+        match = DYNAMIC_TABLE_PATTERN.match(table_name)
+        if not match:
+            continue
+        story_index, list_kind = int(match.group(1)), match.group(2)
+        with engine.begin() as connection:  # Copy and drop in one transaction
+            rows = connection.execute(text(f'SELECT * FROM "{table_name}"')).mappings().all()
+            connection.execute(
+                table.delete().where(table.c.story_index == story_index, table.c.list_kind == list_kind)
+            )
+            if rows:
+                connection.execute(table.insert(), [
+                    {**{key: value for key, value in row.items() if key in columns},
+                     "story_index": story_index, "list_kind": list_kind}
+                    for row in rows
+                ])
+            connection.execute(text(f'DROP TABLE "{table_name}"'))
@@ -0,0 +1,79 @@
+from PySide6.QtCore import Qt, QAbstractListModel, QModelIndex
+from PySide6.QtGui import QColor, QFont
+
+
+NAV_KEY_ROLE = Qt.UserRole  # (nav_type, nav_id) of a row
+SELECTED_BACKGROUND = QColor("#0078d7")
+
+
+class GalleryNavModel(QAbstractListModel):
+    """Characters, places and items for the gallery navigation list, fetched page by page.
+
+    fetch_page(limit, offset) returns (nav_type, nav_id, name) tuples in display order. Rows are
+    loaded as the view scrolls towards the end (canFetchMore/fetchMore), and the selected row is
+    tracked here so changing it only repaints the two rows involved.
+    """
+    def __init__(self, fetch_page, page_size=200, parent=None):
+        super().__init__(parent)
+        self.fetch_page = fetch_page
+        self.page_size = page_size
+        self.rows = []
+        self.row_for_key = {}  # (nav_type, nav_id) -> row
+        self.exhausted = False
+        self.selected_row = None
+        self.font = QFont("Arial", 14)
+        self.selected_font = QFont("Arial", 14, QFont.Bold)
+        self.fetchMore()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.rows)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        row = index.row()
+        nav_type, nav_id, name = self.rows[row]
+        if role == Qt.DisplayRole:
+            return name
+        if role == NAV_KEY_ROLE:
+            return (nav_type, nav_id)
+        if role == Qt.FontRole:
+            return self.selected_font if row == self.selected_row else self.font
+        if role == Qt.BackgroundRole and row == self.selected_row:
+            return SELECTED_BACKGROUND
+        return None
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and not self.exhausted
+
+    def fetchMore(self, parent=QModelIndex()):
+        if parent.isValid() or self.exhausted:
+            return
+        page = self.fetch_page(self.page_size, len(self.rows))
+        if len(page) < self.page_size:
+            self.exhausted = True
+        if not page:
+            return
+        first = len(self.rows)
+        self.beginInsertRows(QModelIndex(), first, first + len(page) - 1)
+        for row, item in enumerate(page, first):
+            self.rows.append(tuple(item))
+            self.row_for_key[(item[0], item[1])] = row
+        self.endInsertRows()
+
+    def row_of(self, nav_key):
+        """Returns the row of nav_key, fetching further pages until it is found, or None."""
+        while nav_key not in self.row_for_key and self.canFetchMore():
+            self.fetchMore()
+        return self.row_for_key.get(nav_key)
+
+    def label(self, nav_key):
+        row = self.row_for_key.get(nav_key)
+        return self.rows[row][2] if row is not None else ""
+
+    def select(self, row):
+        """Marks row as the selected one, repainting only the previous and new selection."""
+        previous_row, self.selected_row = self.selected_row, row
+        for changed_row in {previous_row, row} - {None}:
+            changed_index = self.index(changed_row)
+            self.dataChanged.emit(changed_index, changed_index, [Qt.FontRole, Qt.BackgroundRole])
@@ -1,14 +1,18 @@
 from PySide6.QtWidgets import (
-    QWidget, QGridLayout, QVBoxLayout, QHBoxLayout, QFrame, QPushButton, QLabel, QScrollArea, QSizePolicy, QLineEdit, QFileDialog, QTextEdit, QToolBar, QColorDialog, QFontComboBox, QComboBox)
+    QWidget, QGridLayout, QVBoxLayout, QHBoxLayout, QFrame, QPushButton, QLabel, QScrollArea, QSizePolicy, QLineEdit, QFileDialog, QTextEdit, QToolBar, QColorDialog, QFontComboBox, QComboBox,
+    QListView, QAbstractItemView)
 from PySide6.QtGui import QFont, QIcon, QPixmap, QTextCharFormat, QTextCursor, QColor, QTextListFormat, QAction
 from PySide6.QtCore import Qt, QSize, Signal, QTimer
 import os
-import shutil
+from utils.thumbnails import THUMBNAILS
+from utils.image_import import ImageImportTask, STORE_DIR, start_image_import
+from ui.gallery_nav_model import GalleryNavModel, NAV_KEY_ROLE
 
 
 CHARACTERS_FIELDS = ['name', 'race', 'age', 'role_profession', 'social_status', 'economic_status', 'image_path', 'notes']
 PLACES_FIELDS = ['name', 'weather', 'smell', 'image_path', 'notes']
 ITEMS_FIELDS = ['name', 'material', 'rarity', 'image_path', 'notes']
+MAX_IMAGE_SIDE = 2048  # Larger uploads are downsized on import
 
 
 class GalleryModalUI(QWidget):
@@ -16,23 +20,21 @@ class GalleryModalUI(QWidget):
     details_data_ready = Signal(dict)
     notes_edited = Signal(str)
     close_modal = Signal()
-    image_uploaded = Signal(str)
+    image_import_started = Signal(object)  # ImageImportTask, before it is queued
 
-    def __init__(self, parent, controller, nav_items, first_nav_type=None, first_nav_id=None):
+    def __init__(self, parent, controller, fetch_nav_items, first_nav_type=None, first_nav_id=None):
         super().__init__(parent)
         self.parent_view = parent
         self.controller = controller
-        self.nav_buttons = []
         self.details_values = []
         self.details_fields = None
-        self.selected_nav_btn = None
         self.nav_item_edited_data = {}  # Will hold [nav_type, nav_id, {field: value, ...}] entries
         self.current_nav_type = None
         self.current_nav_id = None
-        self.nav_id_to_label = {}
-        self.nav_btn_map = {}
         self.current_saved_image_path = None
+        self._current_image_path = None
         self.current_notes = None
+        self.image_imports = set()  # (nav_type, nav_id) of uploads still being imported
 
         self.setWindowFlags(Qt.Dialog | Qt.FramelessWindowHint)
         self.setMinimumSize(600, 400)
@@ -74,34 +76,22 @@ class GalleryModalUI(QWidget):
 
         self.layout.addWidget(close_row_container, 0, 0, 1, 13)
 
-        # --- Left Navigation Pane with Scroll ---
-        self.nav_scroll_area = QScrollArea(self)
-        self.nav_scroll_area.setWidgetResizable(True)
-        self.nav_scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarAsNeeded)
-        self.nav_scroll_area.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)
-
-        self.nav_frame = QFrame(self.nav_scroll_area)
-        self.nav_layout = QVBoxLayout(self.nav_frame)
-        self.nav_layout.setContentsMargins(0, 0, 0, 0)
-        self.nav_layout.setSpacing(0)
-
-        for nav_item in nav_items:
-            btn = QPushButton(nav_item[2], self.nav_frame)
-            btn.setFont(QFont("Arial", 14))
-            btn.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
-            btn.setStyleSheet("""
-                padding: 10px;
-                color: white;
-            """)
-            btn.clicked.connect(lambda checked, b=btn, type=nav_item[0], id=nav_item[1]: self.handle_nav_click(b, type, id))
-            self.nav_layout.addWidget(btn)
-            self.nav_buttons.append(btn)
-            self.nav_id_to_label[(nav_item[0], nav_item[1])] = nav_item[2]
-            self.nav_btn_map[(nav_item[0], nav_item[1])] = btn
-
-        self.nav_layout.addStretch()
-        self.nav_scroll_area.setWidget(self.nav_frame)
-        self.layout.addWidget(self.nav_scroll_area, 1, 0, 10, 3)
+        # --- Left Navigation Pane ---
+        # Only the visible rows are painted; further rows are fetched from the database on scroll
+        self.nav_model = GalleryNavModel(fetch_nav_items, parent=self)
+        self.nav_list = QListView(self)
+        self.nav_list.setModel(self.nav_model)
+        self.nav_list.setUniformItemSizes(True)
+        self.nav_list.setSelectionMode(QAbstractItemView.NoSelection)  # Selection is drawn by the model
+        self.nav_list.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.nav_list.setHorizontalScrollBarPolicy(Qt.ScrollBarAsNeeded)
+        self.nav_list.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)
+        self.nav_list.setStyleSheet("""
+            QListView { background-color: #333; color: white; border: none; }
+            QListView::item { padding: 10px; }
+        """)
+        self.nav_list.clicked.connect(lambda index: self.handle_nav_click(*index.data(NAV_KEY_ROLE)))
+        self.layout.addWidget(self.nav_list, 1, 0, 10, 3)
 
         # --- Right Content Area ---
         content_frame = QFrame(self)
@@ -225,32 +215,24 @@ class GalleryModalUI(QWidget):
 
         self.layout.addWidget(content_frame, 1, 3, 10, 10)
 
-        if self.nav_buttons:
-            # Simulate a click on the first nav button
+        if self.nav_model.rowCount():
+            # Simulate a click on the first nav item
             if not first_nav_type:
-                first_nav_type = nav_items[0][0]
+                first_nav_type = self.nav_model.rows[0][0]
             else:
                 first_nav_type = first_nav_type + "s"
             if not first_nav_id:
-                first_nav_id = nav_items[0][1]
-            first_btn = self.nav_btn_map.get((first_nav_type, first_nav_id))
-            QTimer.singleShot(0, lambda: self.handle_nav_click(first_btn, first_nav_type, first_nav_id))
-
-
-    def handle_nav_click(self, btn, nav_type, nav_id):
-        # Highlight the selected button
-        for b in self.nav_buttons:
-            b.setStyleSheet("""
-                padding: 10px;
-                color: white;
-            """)
-        btn.setStyleSheet("""
-            padding: 10px;
-            color: white;
-            background-color: #0078d7;  /* Highlight color */
-            font-weight: bold;
-        """)
-        self.selected_nav_btn = btn
+                first_nav_id = self.nav_model.rows[0][1]
+            QTimer.singleShot(0, lambda: self.handle_nav_click(first_nav_type, first_nav_id))
+
+
+    def handle_nav_click(self, nav_type, nav_id):
+        # Highlight the selected item
+        row = self.nav_model.row_of((nav_type, nav_id))
+        if row is None:
+            return
+        self.nav_model.select(row)
+        self.nav_list.scrollTo(self.nav_model.index(row))
         if nav_type == 'characters':
             self.details_fields = CHARACTERS_FIELDS
         elif nav_type == 'places':
@@ -277,15 +259,19 @@ class GalleryModalUI(QWidget):
             self.set_image(self.current_saved_image_path)
         else:
             self.image_label.clear()
-            self._original_pixmap = None
+            self._current_image_path = None
             self.image_upload_button.setText("Upload Image")
+        importing = (nav_type, nav_id) in self.image_imports
+        self.image_upload_button.setEnabled(not importing)
+        if importing:
+            self.image_upload_button.setText("Importing...")
 
         for i in range(1, len(self.details_values)):
             if self.details_fields and i-1 < len(self.details_fields) - 2:
                 field_name = self.details_fields[i-1]
                 label = field_name.capitalize()
                 if field_name == "name":
-                    nav_label = self.nav_id_to_label.get((nav_type, nav_id), "")
+                    nav_label = self.nav_model.label((nav_type, nav_id))
                     self.details_values[i].setText(nav_label)
                     self.details_values[i].setReadOnly(True)
                 else:
@@ -303,32 +289,49 @@ class GalleryModalUI(QWidget):
             self, "Select Image", "", "Images (*.png *.jpg *.jpeg *.bmp *.gif)"
         )
         if file_path:
-            self.set_image(file_path)  # You can implement set_image as shown in a previous answer
+            self.import_image(file_path)
+
+    def import_image(self, image_path):
+        """Copies, validates and downsizes the chosen image into the image store on a worker thread."""
+        nav_key = (self.current_nav_type, self.current_nav_id)
+        # Re-selecting the stored file needs no import
+        if self._current_image_path and os.path.abspath(image_path) == os.path.abspath(self._current_image_path):
+            return
+        task = ImageImportTask(image_path, max_side=MAX_IMAGE_SIDE, tag=nav_key, store_dir=STORE_DIR)
+        task.signals.progress.connect(self.image_import_progress)
+        task.signals.finished.connect(self.image_import_finished)
+        task.signals.failed.connect(self.image_import_failed)
+        self.image_imports.add(nav_key)
+        self.image_upload_button.setEnabled(False)
+        self.image_upload_button.setText("Importing... 0%")
+        self.image_import_started.emit(task)
+        start_image_import(task)
+
+    def image_import_progress(self, nav_key, percent):
+        if nav_key == (self.current_nav_type, self.current_nav_id):
+            self.image_upload_button.setText(f"Importing... {percent}%")
+
+    def image_import_finished(self, nav_key, image_path, digest):
+        self.image_imports.discard(nav_key)
+        if nav_key == (self.current_nav_type, self.current_nav_id):
+            self.image_upload_button.setEnabled(True)
+            self.set_image(image_path)
+
+    def image_import_failed(self, nav_key, message):
+        self.image_imports.discard(nav_key)
+        if nav_key == (self.current_nav_type, self.current_nav_id):
+            self.image_upload_button.setEnabled(True)
+            self.image_upload_button.setText("Change Image" if self._current_image_path else "Upload Image")
+            self.image_upload_button.setToolTip(message)
 
     def set_image(self, image_path):
-        """Load, save, and display the image, scaled to fit the label."""
-        nav_type = self.current_nav_type
-        nav_id = self.current_nav_id
-        label = self.nav_id_to_label.get((nav_type, nav_id), "image")
-        ext = os.path.splitext(image_path)[1] or ".png"
-        save_dir = os.path.join("visuals", nav_type)
-        os.makedirs(save_dir, exist_ok=True)
-        filename = f"{nav_id}_{label}{ext}"
-        filename = "".join(c if c.isalnum() or c in "._-" else "_" for c in filename)
-        save_path = os.path.join(save_dir, filename)
-        # Only copy if source and destination are different
-        if os.path.abspath(image_path) != os.path.abspath(save_path):
-            shutil.copy(image_path, save_path)
-        self._current_image_path = save_path
-        self.image_uploaded.emit(save_path)
-        pixmap = QPixmap(save_path)
-        if not pixmap.isNull():
-            self._original_pixmap = pixmap
-            self._update_image_pixmap()
+        """Display the stored image, scaled to fit the label."""
+        self._current_image_path = image_path
+        if self._update_image_pixmap():
             self.image_upload_button.setText("Change Image")
         else:
             self.image_label.clear()
-            self._original_pixmap = None
+            self._current_image_path = None
             self.image_upload_button.setText("Upload Image")  
 
     def set_details_placeholders_tooltips(self, text):
@@ -397,13 +400,23 @@ class GalleryModalUI(QWidget):
         self._update_image_pixmap()
 
     def _update_image_pixmap(self):
-        if hasattr(self, '_original_pixmap') and self._original_pixmap:
-            scaled = self._original_pixmap.scaled(
-                self.image_label.size(),
-                Qt.IgnoreAspectRatio,
-                Qt.SmoothTransformation
-            )
-            self.image_label.setPixmap(scaled)
+        """Scales the smallest stored variant covering the label into it; returns False if none loads."""
+        if not getattr(self, '_current_image_path', None):
+            return False
+        label_size = self.image_label.size()
+        try:
+            pixmap = THUMBNAILS.pixmap(self._current_image_path, (label_size.width(), label_size.height()))
+        except OSError:
+            return False
+        if pixmap.isNull():
+            return False
+        scaled = pixmap.scaled(
+            label_size,
+            Qt.IgnoreAspectRatio,
+            Qt.SmoothTransformation
+        )
+        self.image_label.setPixmap(scaled)
+        return True
 
     def toolbar_buttons(self):
         # Bold
@@ -1,7 +1,12 @@
-from functools import partial
-from PySide6.QtWidgets import QWidget, QLabel, QPushButton, QVBoxLayout, QHBoxLayout, QGridLayout, QFrame, QSizePolicy, QScrollArea, QLineEdit, QComboBox, QMessageBox
-from PySide6.QtGui import QFont, QIcon
-from PySide6.QtCore import Qt, QSize, Signal, QTimer, QEvent
+from PySide6.QtWidgets import QWidget, QLabel, QPushButton, QVBoxLayout, QHBoxLayout, QGridLayout, QFrame, QSizePolicy, QMessageBox, QTableView, QAbstractItemView, QHeaderView, QCompleter
+from PySide6.QtGui import QFont, QIcon, QStandardItemModel, QStandardItem
+from PySide6.QtCore import Qt, QSize, Signal, QTimer, QModelIndex
+from ui.story_list_table import StoryListTableModel, ListTextDelegate, EntryTypeDelegate, SECTION_SIZE
+
+
+SUGGESTIONS_DELAY_MS = 60  # Pause in typing before suggestions are looked up
+SUGGESTION_NAME_ROLE = Qt.UserRole
+SUGGESTION_TYPE_ROLE = Qt.UserRole + 1
 
 
 class GameDashboardUI(QWidget):
@@ -68,26 +73,8 @@ class GameDashboardUI(QWidget):
             self.button_layout.addWidget(btn)
 
 
-class ClickableLabel(QLabel):
-    # Utility wrapper for QLabel to emit a signal on click
-    clicked = Signal()
-
-    def mousePressEvent(self, event):
-        self.clicked.emit()
-        super().mousePressEvent(event)
-
-
-class FocusLineEdit(QLineEdit):
-    # Utility wrapper for QLineEdit to emit a signal when focused
-    focused = Signal()
-
-    def focusInEvent(self, event):
-        super().focusInEvent(event)
-        self.focused.emit()
-
-
 class CharactersThreadsTablesUI(QWidget):
-    """UI Layout with both horizontal and vertical scrolling."""
+    """A story's characters or threads list as a QTableView over StoryListTableModel."""
     search_for_suggestions = Signal(dict)
     row_clicked = Signal(dict)
 
@@ -100,7 +87,6 @@ class CharactersThreadsTablesUI(QWidget):
         self.existing_data = existing_data
         self.edited_rows_data_dict = {}
 
-        rows_to_be_updated = self.existing_data.keys()
         self.setStyleSheet("background-color: white;")
         self.layout = QVBoxLayout(self)
         self.layout.setContentsMargins(0, 0, 0, 0)
@@ -143,224 +129,137 @@ class CharactersThreadsTablesUI(QWidget):
         table_container_layout = QVBoxLayout(table_container)
         table_container_layout.setContentsMargins(50, 0, 50, 0)
 
-        scroll_area = QScrollArea(table_container)
-        scroll_area.setWidgetResizable(True)
-        scroll_area.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOn)
-        scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOn)
-        scroll_area.setStyleSheet("border: none; background-color: transparent;")
-
-        scroll_widget = QWidget()
-        self.scroll_widget = scroll_widget  # Store reference for handlers
-        scroll_layout = QGridLayout(scroll_widget)
-        scroll_layout.setSpacing(0)
-
-        section_labels = ["1 - 2", "3 - 4", "5 - 6", "7 - 8", "9 - 10"]
-
-        # Create table structure
-        row_index = 1
-
-        for section_label in section_labels:
-            # **Section Label (Spans 5 Rows, 2 Columns)**
-            section_label_widget = QLabel(section_label, scroll_widget)
-            section_label_widget.setFont(QFont("Arial", 14, QFont.Bold))
-            section_label_widget.setAlignment(Qt.AlignCenter)
-            section_label_widget.setStyleSheet("""
-                border-top: 1px solid black;
-                border-bottom: 2px solid black;
-                border-right: 1px solid black;
-                border-left: 1px solid black;
-                padding: 5px;
+        self.table_model = StoryListTableModel(self.table_label, self.existing_data, parent=self)
+        self.table_model.row_edited.connect(self.edited_row_data)
+        self.text_column = self.table_model.columns.index("name" if self.table_label == "characters" else "thread")
+
+        self.table_view = QTableView(table_container)
+        self.table_view.setModel(self.table_model)
+        self.table_view.setEditTriggers(QAbstractItemView.DoubleClicked)
+        self.table_view.setSelectionMode(QAbstractItemView.NoSelection)
+        self.table_view.horizontalHeader().hide()
+        self.table_view.verticalHeader().hide()
+        self.table_view.verticalHeader().setDefaultSectionSize(45)
+        self.table_view.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOn)
+        self.table_view.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOn)
+        self.table_view.setStyleSheet("""
+            QTableView {
+                border: none;
                 background-color: white;
                 color: black;
-                font-weight: bold;
-            """)
-            scroll_layout.addWidget(section_label_widget, row_index, 0, 5, 2)
-
-            for i in range(5):
-                border_bottom = "2px solid black" if i == 4 else "0.1px solid black"
-                row_label = ClickableLabel(section_labels[i], scroll_widget)
-                row_label.setFont(QFont("Arial", 12, QFont.Bold))
-                row_label.setAlignment(Qt.AlignCenter)
-                row_label.setStyleSheet(f"""
-                    border-top: 1px solid black;
-                    border-bottom: {border_bottom};
-                    border-right: 1px solid black;
-                    border-left: 1px solid black;
-                    padding: 5px;
-                    background-color: white;
-                    color: black;
-                    font-weight: bold;
-                """)
-                scroll_layout.addWidget(row_label, row_index, 2, 1, 2)
-
-                table_cell = FocusLineEdit(scroll_widget)
-                table_cell.setStyleSheet(f"""
-                    border-top: 1px solid black;
-                    border-bottom: {border_bottom};
-                    border-right: 1px solid black;
-                    border-left: 1px solid black;
-                    padding: 10px;
-                    color: black;
-                    font-size: 16px;
-                    background-color: white;
-                """)
-                table_cell.setReadOnly(True)
-                table_cell.setProperty("row_index", row_index)
-
-                dropdown_cell = None
-                if self.table_label == "characters":
-                    dropdown_cell = QComboBox(scroll_widget)
-                    dropdown_cell.addItems([None, "character", "place", "item"])
-                    dropdown_cell.setStyleSheet(f"""
-                        border-top: 1px solid black;
-                        border-bottom: {border_bottom};
-                        border-right: 1px solid black;
-                        border-left: 1px solid black;
-                        padding: 10px;
-                        color: black;
-                        font-size: 16px;
-                        background-color: white;
-                        text-align: center;
-                    """)
-                    dropdown_cell.setEditable(False)
-                    dropdown_cell.setEnabled(False)
-                    dropdown_cell.setProperty("row_index", row_index)
-
-                    if row_index in rows_to_be_updated:
-                        table_cell.setText(self.existing_data[row_index]["name"])
-                        dropdown_cell.setCurrentText(self.existing_data[row_index]["type"])
-
-                    # --- Editable logic ---
-                    row_label.clicked.connect(self.row_click_handler(table_cell, dropdown_cell))
-                    table_cell.focused.connect(self.row_click_handler(table_cell, dropdown_cell))
-                    table_cell.mouseDoubleClickEvent = self.double_click_handler(table_cell)
-                    table_cell.textEdited.connect(self.debounced_emit_search_for_suggestions)
-                    table_cell.editingFinished.connect(self.finish_edit_handler(table_cell, dropdown_cell))
-                    dropdown_cell.currentIndexChanged.connect(self.edited_row_data)
-                    dropdown_cell.currentIndexChanged.connect(self.dropdown_selection_handler(dropdown_cell, table_cell))
-
-                    scroll_layout.addWidget(dropdown_cell, row_index, 10, 1, 2)
-
-                elif self.table_label == "threads":
-                    if row_index in rows_to_be_updated:
-                        table_cell.setText(self.existing_data[row_index]["thread"])
-
-                    row_label.mousePressEvent = self.row_click_handler(table_cell)
-                    table_cell.mousePressEvent = self.row_click_handler(table_cell)
-                    table_cell.mouseDoubleClickEvent = self.double_click_handler(table_cell)
-                    table_cell.textEdited.connect(self.debounced_emit_search_for_suggestions)
-                    table_cell.editingFinished.connect(self.finish_edit_handler(table_cell))
-                    table_cell.editingFinished.connect(self.edited_row_data)
-
-                scroll_layout.addWidget(table_cell, row_index, 4, 1, 6)
-                row_index += 1
-
-        scroll_area.setWidget(scroll_widget)
-        table_container_layout.addWidget(scroll_area)
+                gridline-color: black;
+                font-size: 16px;
+            }
+        """)
+        header = self.table_view.horizontalHeader()
+        header.setSectionResizeMode(QHeaderView.ResizeToContents)
+        header.setSectionResizeMode(self.text_column, QHeaderView.Stretch)
+
+        # Suggestions arrive already ranked, so the completer shows them as is
+        self.suggestions_model = QStandardItemModel(self)
+        self.completer = QCompleter(self.suggestions_model, self)
+        self.completer.setCompletionMode(QCompleter.UnfilteredPopupCompletion)
+        self.completer.setCompletionRole(SUGGESTION_NAME_ROLE)  # Insert the bare name
+        self.completer.activated[QModelIndex].connect(self.suggestion_activated)
+
+        # One delegate per editable column instead of a widget per cell
+        self.text_delegate = ListTextDelegate(self.table_view, completer=self.completer)
+        self.text_delegate.text_edited.connect(self.debounced_emit_search_for_suggestions)
+        self.table_view.setItemDelegateForColumn(self.text_column, self.text_delegate)
+        if self.table_label == "characters":
+            self.type_column = self.table_model.columns.index("type")
+            self.table_view.setItemDelegateForColumn(self.type_column, EntryTypeDelegate(self.table_view))
+            header.setSectionResizeMode(self.type_column, QHeaderView.Fixed)
+            header.resizeSection(self.type_column, 160)
+        self.table_view.clicked.connect(self.row_click_handler)
+        self.span_sections(0)
+
+        # Typing is reported once it pauses, for the row being edited
+        self.suggestions_timer = QTimer(self)
+        self.suggestions_timer.setSingleShot(True)
+        self.suggestions_timer.timeout.connect(self.emit_search_for_suggestions)
+        self.pending_suggestion = None
+
+        table_container_layout.addWidget(self.table_view)
         self.layout.addWidget(table_container)
         self.setLayout(self.layout)
 
+    def span_sections(self, first_row):
+        """Merges the section label cell of every section from first_row on."""
+        for row in range(first_row, self.table_model.rowCount(), SECTION_SIZE):
+            self.table_view.setSpan(row, 0, SECTION_SIZE, 1)
 
-    def row_click_handler(self, table_cell, dropdown_cell=None):
-        def handler():
-            if table_cell.isReadOnly():
-                row_index = table_cell.property("row_index")
-                if dropdown_cell:
-                    data = {
-                        "name": table_cell.text(),
-                        "type": dropdown_cell.currentText(),
-                        "row_index": row_index
-                    }
-                    self.row_clicked.emit(data)
-                else:
-                    data = {
-                        "thread": table_cell.text(),
-                        "row_index": row_index
-                    }
-                    self.row_clicked.emit(data)
-        return handler
-
-    def double_click_handler(self, table_cell):
-        def handler(event):
-            if event.type() == QEvent.MouseButtonDblClick and table_cell.isReadOnly():
-                # Set all table_cells to read-only and all dropdowns to disabled
-                for le in self.scroll_widget.findChildren(QLineEdit):
-                    le.setReadOnly(True)
-                for cb in self.scroll_widget.findChildren(QComboBox):
-                    cb.setEnabled(False)
-                # Now enable only the current cell and dropdown
-                table_cell.setReadOnly(False)
-                table_cell.setFocus()
-                table_cell.setCursorPosition(len(table_cell.text()))
-                row_index = table_cell.property("row_index")
-                for cb in self.scroll_widget.findChildren(QComboBox):
-                    if cb.property("row_index") == row_index:
-                        cb.setEnabled(True)
-        return handler
-    
-    def emit_search_for_suggestions(self, row_index, table_cell, text_from_signal):
-        self.search_for_suggestions.emit({
-            "row": row_index,
-            "data": table_cell.text()
-        })
-
-    def debounced_emit_search_for_suggestions(self, text):
-        sender = self.sender()
-        row_index = sender.property("row_index")
-        if not hasattr(self, "debounce_timers"):
-            self.debounce_timers = {}
-        # Stop any existing timer for this sender
-        if sender in self.debounce_timers:
-            self.debounce_timers[sender].stop()
+    def row_click_handler(self, index):
+        if self.table_view.state() == QAbstractItemView.EditingState:
+            return
+        row_index = index.row() + 1
+        row = self.table_model.row_data(row_index)
+        if self.table_label == "characters":
+            data = {"name": row.get("name") or "", "type": row.get("type") or ""}
         else:
-            self.debounce_timers[sender] = QTimer(self)
-            self.debounce_timers[sender].setSingleShot(True)
-            # Use a lambda to capture the current sender and row_index
-            self.debounce_timers[sender].timeout.connect(
-                lambda s=sender, r=row_index: self.search_for_suggestions.emit({
-                    "row": r,
-                    "data": s.text()
-                })
-            )
-        self.debounce_timers[sender].start(400)
-
-    def finish_edit_handler(self, table_cell, dropdown_cell=None):
-        def handler():
-            table_cell.setReadOnly(True)
-        return handler
-
-    def edited_row_data(self):
-        sender = self.sender()
-        row_index = sender.property("row_index")
+            data = {"thread": row.get("thread") or ""}
+        data["row_index"] = row_index
+        self.row_clicked.emit(data)
+
+    def edit_entry_type(self, row_index):
+        if not self.table_model.row_data(row_index).get("type"):
+            self.table_view.edit(self.table_model.index(row_index - 1, self.type_column))
+
+    def emit_search_for_suggestions(self):
+        if self.pending_suggestion is not None:
+            row_index, text = self.pending_suggestion
+            self.search_for_suggestions.emit({
+                "row": row_index,
+                "data": text
+            })
+
+    def debounced_emit_search_for_suggestions(self, row_index, text):
+        self.pending_suggestion = (row_index, text)
+        self.suggestions_timer.start(SUGGESTIONS_DELAY_MS)
+
+    def show_suggestions(self, row_index, suggestions):
+        """Lists (name, entry_type) suggestions under the cell being edited in row_index."""
+        if self.pending_suggestion is None or self.pending_suggestion[0] != row_index:
+            return  # The user has moved on to another row
+        self.suggestions_model.clear()
+        for name, entry_type in suggestions:
+            item = QStandardItem(f"{name} ({entry_type})" if entry_type else name)
+            item.setData(name, SUGGESTION_NAME_ROLE)
+            item.setData(entry_type, SUGGESTION_TYPE_ROLE)
+            self.suggestions_model.appendRow(item)
+        if suggestions and self.completer.widget() is not None:
+            self.completer.complete()
+
+    def suggestion_activated(self, index):
+        """Takes over the entry type of a picked suggestion for the row being edited."""
+        entry_type = index.data(SUGGESTION_TYPE_ROLE)
+        if self.pending_suggestion is None or not entry_type or self.table_label != "characters":
+            return
+        row_index = self.pending_suggestion[0]
+        if not self.table_model.row_data(row_index).get("type"):
+            self.table_model.setData(self.table_model.index(row_index - 1, self.type_column), entry_type)
+
+    def edited_row_data(self, row_index):
+        """Records a changed row for saving, once it holds everything the list needs."""
+        data = self.table_model.row_data(row_index)
         if self.table_label == "characters":
-            # sender is dropdown_cell
-            table_cell = None
-            # Find the table_cell for this row
-            for le in self.scroll_widget.findChildren(QLineEdit):
-                if le.property("row_index") == row_index:
-                    table_cell = le
-                    break
-            if table_cell and sender.currentText():
+            if data.get("name") and not data.get("type"):
+                # Pick the entry type next, as the row is only saved with one
+                QTimer.singleShot(0, lambda: self.edit_entry_type(row_index))  # Once the name editor has closed
+                return
+            if data.get("name") and data.get("type"):
                 self.edited_rows_data_dict[row_index] = {
-                    "name": table_cell.text(),
-                    "type": sender.currentText()
+                    "name": data["name"],
+                    "type": data["type"]
                 }
-                table_cell.clearFocus()
         elif self.table_label == "threads":
-            # sender is table_cell
-            if sender.text():
+            if data.get("thread"):
                 self.edited_rows_data_dict[row_index] = {
-                    "thread": sender.text()
+                    "thread": data["thread"]
                 }
-                sender.clearFocus()
-
-    def dropdown_selection_handler(self, dropdown_cell, table_cell):
-        def handler(index):
-            # Only disable if a valid selection is made (not None or empty)
-            if dropdown_cell.currentText():
-                dropdown_cell.setEnabled(False)
-                table_cell.setReadOnly(True)
-        return handler
+        first_new_row = self.table_model.rowCount()
+        if self.table_model.ensure_free_section():
+            self.span_sections(first_new_row)
 
     def send_edited_rows_data_dict(self):
         return self.edited_rows_data_dict
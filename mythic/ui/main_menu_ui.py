@@ -1,4 +1,4 @@
-from PySide6.QtWidgets import (QWidget, QLabel, QPushButton, QVBoxLayout, QGridLayout, QFrame, QSizePolicy, QLineEdit, QTextEdit, QHBoxLayout, QScrollArea, QMessageBox, QDialog)
+from PySide6.QtWidgets import (QWidget, QLabel, QPushButton, QVBoxLayout, QGridLayout, QFrame, QSizePolicy, QLineEdit, QTextEdit, QHBoxLayout, QScrollArea, QMessageBox, QDialog, QStackedWidget)
 from PySide6.QtGui import QFont, QIcon
 from PySide6.QtCore import Qt, Signal, QTimer, QSize, Slot
 from views.game_dashboard import GameDashboardView
@@ -541,23 +541,10 @@ class OraclesTablesUI(QWidget):
 
         # --- Right Content Area ---
 
-        # --- Center content Navigation Pane with Scroll ---
-        self.content_nav_scroll_area = QScrollArea(self)
-        self.content_nav_scroll_area.setWidgetResizable(True)
-        self.content_nav_scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarAsNeeded)
-        self.content_nav_scroll_area.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)
-
-        self.content_nav_frame = QFrame(self.content_nav_scroll_area)
-        content_layout = QGridLayout(self.content_nav_frame)
-        content_layout.setContentsMargins(0, 0, 0, 0)
-        content_layout.setSpacing(0)
-
-        self.content_nav_frame.setStyleSheet("""
-            background-color: white;
-        """)
-
-        self.content_nav_scroll_area.setWidget(self.content_nav_frame)
-        self.layout.addWidget(self.content_nav_scroll_area, 1, 3, 10, 10)
+        # --- Center content: one page per table, built on first visit and kept ---
+        self.table_pages = QStackedWidget(self)
+        self.table_page_map = {}  # Table name -> its page in table_pages
+        self.layout.addWidget(self.table_pages, 1, 3, 10, 10)
 
         if self.nav_buttons:
             first_nav_item = nav_items[0]
@@ -565,9 +552,9 @@ class OraclesTablesUI(QWidget):
             QTimer.singleShot(0, lambda: self.handle_nav_click(first_btn, first_nav_item))
 
     def handle_nav_click(self, btn, nav_item):
-        # Highlight the selected button
-        for b in self.nav_buttons:
-            b.setStyleSheet("""
+        # Highlight the selected button, restyling only the one that loses the highlight
+        if self.selected_nav_btn is not None and self.selected_nav_btn is not btn:
+            self.selected_nav_btn.setStyleSheet("""
                 padding: 10px;
                 color: white;
             """)
@@ -583,12 +570,31 @@ class OraclesTablesUI(QWidget):
         self.nav_item_selected.emit(nav_item)
         # self.update_content_for_nav(nav_item)
 
+    def show_table_page(self, nav_item):
+        """Flips to the page already built for nav_item; returns False if there is none yet."""
+        page = self.table_page_map.get(nav_item)
+        if page is None:
+            return False
+        self.table_pages.setCurrentWidget(page)
+        return True
+
+    def new_table_page(self, nav_item):
+        """Creates the scrollable, initially empty page for nav_item and returns its content frame."""
+        page = QScrollArea(self.table_pages)
+        page.setWidgetResizable(True)
+        page.setHorizontalScrollBarPolicy(Qt.ScrollBarAsNeeded)
+        page.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)
+        content_nav_frame = QFrame(page)
+        content_nav_frame.setStyleSheet("""
+            background-color: white;
+        """)
+        page.setWidget(content_nav_frame)
+        self.table_pages.addWidget(page)
+        self.table_page_map[nav_item] = page
+        return content_nav_frame
+
     def render_fate_chart(self, nav_item, table):
-        # Remove previous content
-        for i in reversed(range(self.content_nav_frame.layout().count())):
-            widget = self.content_nav_frame.layout().itemAt(i).widget()
-            if widget:
-                widget.setParent(None)
+        self.content_nav_frame = self.new_table_page(nav_item)
 
         # Create a new layout for the table
         table_layout = QGridLayout()
@@ -650,11 +656,8 @@ class OraclesTablesUI(QWidget):
             cf_label.setStyleSheet("background-color: #eee; color: black; border: 1px solid #aaa; padding: 8px;")
             table_layout.addWidget(cf_label, chaos_row, i)
 
-        # Set the new layout to the content_nav_frame
-        old_layout = self.content_nav_frame.layout()
-        if old_layout:
-            QWidget().setLayout(old_layout)
         self.content_nav_frame.setLayout(table_layout)
+        self.show_table_page(nav_item)
 
     def render_random_event_focus_table(self, nav_item, table):
         """
@@ -662,13 +665,7 @@ class OraclesTablesUI(QWidget):
         `table` should be a list of 10 (number, string) tuples.
         The table fills the content area vertically.
         """
-        # Remove previous content
-        layout = self.content_nav_frame.layout()
-        if layout:
-            for i in reversed(range(layout.count())):
-                widget = layout.itemAt(i).widget()
-                if widget:
-                    widget.setParent(None)
+        self.content_nav_frame = self.new_table_page(nav_item)
 
         grid = QGridLayout()
         grid.setSpacing(0)
@@ -695,24 +692,15 @@ class OraclesTablesUI(QWidget):
         # Make the table fill the content area vertically
         grid.setRowStretch(row_count, 1)
 
-        # Set the new layout to the content_nav_frame
-        old_layout = self.content_nav_frame.layout()
-        if old_layout:
-            QWidget().setLayout(old_layout)
         self.content_nav_frame.setLayout(grid)
+        self.show_table_page(nav_item)
 
     def render_d100_table(self, nav_item, table):
         """
         Renders a d100 table with 8 columns: (No., Word) pairs for 1-25, 26-50, 51-75, 76-100.
         `table` should be a list of (number, word) tuples.
         """
-        # Remove previous content
-        layout = self.content_nav_frame.layout()
-        if layout:
-            for i in reversed(range(layout.count())):
-                widget = layout.itemAt(i).widget()
-                if widget:
-                    widget.setParent(None)
+        self.content_nav_frame = self.new_table_page(nav_item)
 
         # Ensure table is sorted by number
         items = sorted(table, key=lambda x: x[0])
@@ -740,11 +728,8 @@ class OraclesTablesUI(QWidget):
                     grid.addWidget(num_label, row+1, col*2)
                     grid.addWidget(word_label, row+1, col*2+1)
 
-        # Set the new layout to the content_nav_frame
-        old_layout = self.content_nav_frame.layout()
-        if old_layout:
-            QWidget().setLayout(old_layout)
         self.content_nav_frame.setLayout(grid)
+        self.show_table_page(nav_item)
 
 
 class ArtifactsUI(QWidget):
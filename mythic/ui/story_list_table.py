@@ -0,0 +1,132 @@
+from PySide6.QtWidgets import QStyledItemDelegate, QLineEdit, QComboBox
+from PySide6.QtGui import QFont
+from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex, Signal
+
+
+SECTION_SIZE = 5
+# Rows are picked with two rolls: one for the section, one for the row within it
+ROLL_LABELS = ["1 - 2", "3 - 4", "5 - 6", "7 - 8", "9 - 10"]
+LIST_SIZE = SECTION_SIZE * len(ROLL_LABELS)
+ENTRY_TYPES = ["", "character", "place", "item"]
+
+# Columns per list kind; the first two are the roll labels, the rest are editable fields
+COLUMNS = {
+    "characters": ["section", "roll", "name", "type"],
+    "threads": ["section", "roll", "thread"],
+}
+
+
+class StoryListTableModel(QAbstractTableModel):
+    """A story's characters or threads list, one row per list row, with rows held in a plain list.
+
+    Row n of the list (1-based, as stored in the database) is rows[n - 1], so reads and edits never
+    search. The list is always a whole number of 5-row sections and grows by a section once its
+    last section gets an entry.
+    """
+    row_edited = Signal(int)  # List row whose fields were changed by the user
+
+    def __init__(self, list_kind, existing_data, min_rows=LIST_SIZE, parent=None):
+        super().__init__(parent)
+        self.columns = COLUMNS[list_kind]
+        row_count = max([min_rows, *existing_data])
+        row_count = -(-row_count // SECTION_SIZE) * SECTION_SIZE  # Round up to whole sections
+        self.rows = [dict(existing_data.get(row, {})) for row in range(1, row_count + 1)]
+        self.label_font = QFont("Arial", 12, QFont.Bold)
+        self.section_font = QFont("Arial", 14, QFont.Bold)
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.columns)
+
+    def section_label(self, row):
+        """Returns the section roll label of a 0-based row; lists past 25 rows are numbered."""
+        label = ROLL_LABELS[row // SECTION_SIZE % len(ROLL_LABELS)]
+        page = row // LIST_SIZE
+        return f"{label} ({page + 1})" if page else label
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        row, column = index.row(), self.columns[index.column()]
+        if role in (Qt.DisplayRole, Qt.EditRole):
+            if column == "section":
+                return self.section_label(row)
+            if column == "roll":
+                return ROLL_LABELS[row % SECTION_SIZE]
+            return self.rows[row].get(column) or ""
+        if role == Qt.FontRole:
+            if column == "section":
+                return self.section_font
+            if column == "roll":
+                return self.label_font
+        if role == Qt.TextAlignmentRole and column in ("section", "roll", "type"):
+            return Qt.AlignCenter
+        return None
+
+    def flags(self, index):
+        flags = super().flags(index)
+        if index.isValid() and index.column() >= 2:
+            flags |= Qt.ItemIsEditable
+        return flags
+
+    def setData(self, index, value, role=Qt.EditRole):
+        if role != Qt.EditRole or not index.isValid() or index.column() < 2:
+            return False
+        row, column = index.row(), self.columns[index.column()]
+        if (self.rows[row].get(column) or "") == value:
+            return False
+        self.rows[row][column] = value
+        self.dataChanged.emit(index, index, [Qt.DisplayRole, Qt.EditRole])
+        self.row_edited.emit(row + 1)
+        return True
+
+    def row_data(self, row):
+        """Returns the fields of list row `row` (1-based)."""
+        return self.rows[row - 1]
+
+    def ensure_free_section(self):
+        """Appends an empty section once the last one has an entry; returns True if rows were added."""
+        last_section = self.rows[-SECTION_SIZE:]
+        if not any(value for row in last_section for value in row.values()):
+            return False
+        first = len(self.rows)
+        self.beginInsertRows(QModelIndex(), first, first + SECTION_SIZE - 1)
+        self.rows.extend({} for _ in range(SECTION_SIZE))
+        self.endInsertRows()
+        return True
+
+
+class ListTextDelegate(QStyledItemDelegate):
+    """Line edit for name/thread cells that reports every keystroke with its list row.
+
+    Editors share `completer` when one is set, so suggestions follow whichever cell is being edited.
+    """
+    text_edited = Signal(int, str)  # List row (1-based), current text
+
+    def __init__(self, parent=None, completer=None):
+        super().__init__(parent)
+        self.completer = completer
+
+    def createEditor(self, parent, option, index):
+        editor = QLineEdit(parent)
+        if self.completer is not None:
+            editor.setCompleter(self.completer)
+        editor.textEdited.connect(lambda text, row=index.row() + 1: self.text_edited.emit(row, text))
+        return editor
+
+
+class EntryTypeDelegate(QStyledItemDelegate):
+    """Drop-down for the character/place/item column, committing as soon as a type is picked."""
+    def createEditor(self, parent, option, index):
+        editor = QComboBox(parent)
+        editor.addItems(ENTRY_TYPES)
+        editor.activated.connect(lambda _, e=editor: (self.commitData.emit(e), self.closeEditor.emit(e)))
+        return editor
+
+    def setEditorData(self, editor, index):
+        editor.setCurrentText(index.data(Qt.EditRole))
+
+    def setModelData(self, editor, model, index):
+        model.setData(index, editor.currentText(), Qt.EditRole)
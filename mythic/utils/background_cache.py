@@ -0,0 +1,98 @@
+import hashlib
+import os
+from collections import OrderedDict
+from PySide6.QtGui import QImage, QPixmap
+from PySide6.QtCore import QObject, QRunnable, Signal
+from PIL import Image
+
+
+def scale_image(image_path, size):
+    """Decodes image_path and LANCZOS-resizes it to size, returning a QImage that owns its pixels."""
+    img = Image.open(image_path).convert("RGB")
+
+    # Resize only if necessary
+    if img.size != tuple(size):
+        img = img.resize(tuple(size), Image.Resampling.LANCZOS)
+
+    qimage = QImage(img.tobytes(), img.width, img.height, img.width * 3, QImage.Format_RGB888)
+    return qimage.copy()  # Detach from the PIL buffer, which is freed with img
+
+
+class BackgroundCache:
+    """Pre-scaled background pixmaps keyed by (path, size, mtime), with an optional on-disk copy.
+
+    Only the memory side needs the GUI thread (QPixmap); load_image() is safe to call from workers.
+    """
+    def __init__(self, max_entries=8, cache_dir=None):
+        self.max_entries = max_entries
+        self.cache_dir = cache_dir
+        self.pixmaps = OrderedDict()
+
+    def key(self, image_path, size):
+        return (os.path.abspath(image_path), tuple(size), os.stat(image_path).st_mtime_ns)
+
+    def get(self, key):
+        """Returns the cached pixmap for key, or None."""
+        pixmap = self.pixmaps.get(key)
+        if pixmap is not None:
+            self.pixmaps.move_to_end(key)
+        return pixmap
+
+    def put(self, key, pixmap):
+        self.pixmaps[key] = pixmap
+        self.pixmaps.move_to_end(key)
+        while len(self.pixmaps) > self.max_entries:
+            self.pixmaps.popitem(last=False)
+
+    def disk_path(self, key):
+        path, (width, height), mtime = key
+        digest = hashlib.sha1(f"{path}|{mtime}".encode("utf-8")).hexdigest()[:16]
+        return os.path.join(self.cache_dir, f"{digest}_{width}x{height}.png")
+
+    def load_image(self, key):
+        """Returns the scaled QImage for key from the disk cache, decoding and storing it on a miss."""
+        path, size, _ = key
+        if self.cache_dir:
+            cached_path = self.disk_path(key)
+            if os.path.exists(cached_path):
+                image = QImage(cached_path)
+                if not image.isNull():
+                    return image
+        image = scale_image(path, size)
+        if self.cache_dir:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            tmp_path = f"{cached_path}.{os.getpid()}.tmp.png"
+            if image.save(tmp_path):
+                os.replace(tmp_path, cached_path)
+        return image
+
+    def pixmap(self, image_path, size):
+        """Returns the background scaled to size, loading it only if it is not cached yet."""
+        key = self.key(image_path, size)
+        pixmap = self.get(key)
+        if pixmap is None:
+            pixmap = QPixmap.fromImage(self.load_image(key))
+            self.put(key, pixmap)
+        return pixmap
+
+
+class BackgroundLoadSignals(QObject):
+    loaded = Signal(object, QImage)  # cache key, scaled image
+    failed = Signal(object)  # cache key
+
+
+class BackgroundLoadTask(QRunnable):
+    """Runs BackgroundCache.load_image() on a thread pool worker and reports back through signals."""
+    def __init__(self, cache, key):
+        super().__init__()
+        self.cache = cache
+        self.key = key
+        self.signals = BackgroundLoadSignals()
+
+    def run(self):
+        try:
+            image = self.cache.load_image(self.key)
+        except Exception:
+            self.signals.failed.emit(self.key)
+            return
+        self.signals.loaded.emit(self.key, image)
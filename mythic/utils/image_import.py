@@ -0,0 +1,123 @@
+import hashlib
+import os
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal
+from PIL import Image
+from utils.thumbnails import generate_thumbnails, remove_thumbnails
+
+
+CHUNK_SIZE = 1024 * 1024
+# Content-addressed image store: visuals/store/<ab>/<cd>/<sha256><ext>
+STORE_DIR = os.path.join("visuals", "store")
+# Formats that are re-encoded when downsizing; anything else (e.g. animated GIFs) is kept as uploaded
+RESIZABLE_FORMATS = {"JPEG", "PNG", "BMP"}
+# Store file extension per decoded format; other formats use their lower-cased name
+FORMAT_EXTENSIONS = {"JPEG": ".jpg", "PNG": ".png", "GIF": ".gif", "BMP": ".bmp", "WEBP": ".webp", "TIFF": ".tif"}
+
+
+# Tasks that have been started and not finished yet; holding them keeps their signals alive
+# even if the widget that started the import is deleted in the meantime
+_IN_FLIGHT = set()
+
+
+class ImageImportSignals(QObject):
+    progress = Signal(object, int)  # Tag, percent of the source file copied
+    finished = Signal(object, str, str)  # Tag, final path, sha256 of the stored file
+    failed = Signal(object, str)  # Tag, error message
+
+
+def content_path(digest, ext, store_dir=STORE_DIR):
+    """Returns where the image with this sha256 lives in the store, sharded on the first two bytes."""
+    return os.path.join(store_dir, digest[:2], digest[2:4], f"{digest}{ext.lower()}")
+
+
+def image_extension(path):
+    """Returns the store extension for an image file, taken from its decoded format rather than its name.
+
+    Identical bytes always decode to the same format, so an image's digest alone decides its store path.
+    """
+    with Image.open(path) as img:
+        image_format = img.format or "PNG"
+    return FORMAT_EXTENSIONS.get(image_format, f".{image_format.lower()}")
+
+
+class ImageImportTask(QRunnable):
+    """Copies, validates, optionally downsizes and hashes an uploaded image on a thread pool worker.
+
+    The file goes to dest_path, or to its content_path() under store_dir when that is given, in which
+    case an image already in the store is reused as is. It is assembled in a temporary file and only
+    moved into place once it is a valid image, so a failed import never leaves a broken file behind.
+    """
+    def __init__(self, source_path, dest_path=None, max_side=None, tag=None, store_dir=None):
+        super().__init__()
+        self.source_path = source_path
+        self.dest_path = dest_path
+        self.store_dir = store_dir
+        self.max_side = max_side
+        self.tag = tag  # Passed back with every signal, e.g. the (nav_type, nav_id) being uploaded for
+        self.signals = ImageImportSignals()
+        self.signals.finished.connect(lambda *args: _IN_FLIGHT.discard(self))
+        self.signals.failed.connect(lambda *args: _IN_FLIGHT.discard(self))
+
+    def run(self):
+        tmp_dir = self.store_dir or os.path.dirname(self.dest_path)
+        tmp_path = os.path.join(tmp_dir, f".import.{os.getpid()}.{id(self)}.tmp")
+        try:
+            os.makedirs(tmp_dir, exist_ok=True)
+            digest = self.copy(tmp_path)
+            with Image.open(tmp_path) as img:
+                img.verify()  # Raises on truncated or non-image files
+            if self.max_side:
+                digest = self.downsize(tmp_path) or digest
+            if self.store_dir:
+                dest_path = content_path(digest, image_extension(tmp_path), self.store_dir)
+                if os.path.exists(dest_path):
+                    os.remove(tmp_path)  # Same image already stored, along with its variants
+                    self.signals.finished.emit(self.tag, dest_path, digest)
+                    return
+                os.makedirs(os.path.dirname(dest_path), exist_ok=True)
+            else:
+                dest_path = self.dest_path
+            os.replace(tmp_path, dest_path)
+            remove_thumbnails(dest_path)
+            generate_thumbnails(dest_path)
+        except Exception as e:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            self.signals.failed.emit(self.tag, f"Could not import {os.path.basename(self.source_path)}: {e}")
+            return
+        self.signals.finished.emit(self.tag, dest_path, digest)
+
+    def copy(self, tmp_path):
+        """Copies the source in chunks, reporting progress, and returns its sha256."""
+        total = os.path.getsize(self.source_path) or 1
+        copied = 0
+        sha256 = hashlib.sha256()
+        with open(self.source_path, "rb") as src, open(tmp_path, "wb") as dst:
+            while chunk := src.read(CHUNK_SIZE):
+                sha256.update(chunk)
+                dst.write(chunk)
+                copied += len(chunk)
+                self.signals.progress.emit(self.tag, copied * 100 // total)
+        return sha256.hexdigest()
+
+    def downsize(self, tmp_path):
+        """Re-encodes the image in place if its longest side exceeds max_side; returns the new sha256."""
+        resized_path = f"{tmp_path}.resized"
+        with Image.open(tmp_path) as img:
+            if img.format not in RESIZABLE_FORMATS or max(img.size) <= self.max_side:
+                return None
+            image_format = img.format
+            img.thumbnail((self.max_side, self.max_side), Image.Resampling.LANCZOS)
+            if image_format == "JPEG":
+                img.convert("RGB").save(resized_path, image_format, quality=92)
+            else:
+                img.save(resized_path, image_format)
+        os.replace(resized_path, tmp_path)
+        with open(tmp_path, "rb") as f:
+            return hashlib.file_digest(f, "sha256").hexdigest()
+
+
+def start_image_import(task, pool=None):
+    """Runs an ImageImportTask on pool (the global pool by default), keeping it alive until it reports back."""
+    _IN_FLIGHT.add(task)
+    (pool or QThreadPool.globalInstance()).start(task)
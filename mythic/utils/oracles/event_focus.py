@@ -0,0 +1,46 @@
+import random
+from ..static_data.mythic_tables.page_197 import RANDOM_EVENT_FOCUS_TABLE
+
+
+def expand_ranges(table):
+    """Expands a ('lo-hi', label) range table into a 100-slot tuple indexed by d100 - 1."""
+    slots = [None] * 100
+    for num_range, label in table:
+        low, _, high = num_range.partition("-")
+        for roll in range(int(low), int(high or low) + 1):
+            slots[roll - 1] = label
+    if None in slots:
+        raise ValueError(f"Range table does not cover d100 roll {slots.index(None) + 1}")
+    return tuple(slots)
+
+
+FOCUS_SLOTS = expand_ranges(RANDOM_EVENT_FOCUS_TABLE)
+FOCUS_LABELS = tuple(label for _, label in RANDOM_EVENT_FOCUS_TABLE)
+
+
+def focus_for_roll(roll):
+    """Returns the event focus for a d100 roll."""
+    if not 1 <= roll <= 100:
+        raise ValueError(f"d100 roll must be between 1 and 100, got {roll!r}")
+    return FOCUS_SLOTS[roll - 1]
+
+
+def focus_for_rolls(rolls):
+    """Returns the event focus for each d100 roll in an iterable."""
+    slots = FOCUS_SLOTS
+    return [slots[roll - 1] if 0 < roll <= 100 else focus_for_roll(roll) for roll in rolls]
+
+
+class EventFocusRoller:
+    """Rolls on the Random Event Focus Table from its own seeded generator."""
+    def __init__(self, seed=None, rng=None):
+        self.rng = rng if rng is not None else random.Random(seed)
+
+    def roll_focus(self, n=1):
+        """Returns n event focus results drawn in a single call."""
+        return self.rng.choices(FOCUS_SLOTS, k=n)
+
+    def roll_focus_with_rolls(self, n=1):
+        """Returns n (d100, event focus) pairs."""
+        rolls = self.rng.choices(range(1, 101), k=n)
+        return list(zip(rolls, focus_for_rolls(rolls)))
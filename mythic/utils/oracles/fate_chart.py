@@ -0,0 +1,109 @@
+import random
+from array import array
+from ..static_data.mythic_tables.page_194 import FATE_CHART, FATE_QUESTION_ANSWERS
+
+
+# Odds labels in chart order ('certain' ... 'impossible') and the chaos factor columns
+ODDS = tuple(row[0] for row in FATE_CHART)
+CHAOS_FACTORS = range(1, 10)
+
+# Result codes index straight into FATE_QUESTION_ANSWERS
+YES, EXCEPTIONAL_YES, NO, EXCEPTIONAL_NO = range(4)
+ANSWERS = tuple(answer for answer, _ in FATE_QUESTION_ANSWERS)
+
+# 'X' cells in the chart (result not possible) are stored as this value
+NO_THRESHOLD = -1
+
+
+def compile_thresholds(chart):
+    """Flattens the chart into a dense odds x chaos factor x 3 array of thresholds."""
+    thresholds = array("b")
+    for row in chart:
+        for cell in row[1:]:
+            thresholds.extend(NO_THRESHOLD if value == "X" else value for value in cell)
+    return thresholds
+
+
+def compile_outcomes(thresholds):
+    """Expands the thresholds into a result code for every (odds, chaos factor, d100) cell."""
+    outcomes = bytearray()
+    for i in range(0, len(thresholds), 3):
+        low, mid, high = thresholds[i:i + 3]
+        for roll in range(1, 101):
+            if low != NO_THRESHOLD and roll <= low:
+                outcomes.append(EXCEPTIONAL_YES)
+            elif roll <= mid:
+                outcomes.append(YES)
+            elif high != NO_THRESHOLD and roll >= high:
+                outcomes.append(EXCEPTIONAL_NO)
+            else:
+                outcomes.append(NO)
+    return bytes(outcomes)
+
+
+THRESHOLDS = compile_thresholds(FATE_CHART)
+OUTCOMES = compile_outcomes(THRESHOLDS)
+
+# Offset of the d100 = 0 slot for every (odds, chaos factor) pair, keyed by odds label and by odds index
+_BASES = {}
+for _odds_index, _odds in enumerate(ODDS):
+    for _chaos_factor in CHAOS_FACTORS:
+        _offset = (_odds_index * len(CHAOS_FACTORS) + _chaos_factor - 1) * 100 - 1
+        _BASES[(_odds, _chaos_factor)] = _offset
+        _BASES[(_odds_index, _chaos_factor)] = _offset
+
+
+def odds_index(odds):
+    """Returns the chart row for an odds label (case-insensitive) or row index."""
+    if isinstance(odds, str):
+        odds = odds.strip().lower()
+        if odds in ODDS:
+            return ODDS.index(odds)
+    elif odds in range(len(ODDS)):
+        return odds
+    raise ValueError(f"Unknown odds: {odds!r}")
+
+
+def _base(odds, chaos_factor):
+    base = _BASES.get((odds, chaos_factor))
+    if base is None:
+        if chaos_factor not in CHAOS_FACTORS:
+            raise ValueError(f"Chaos factor must be between 1 and 9, got {chaos_factor!r}")
+        base = _BASES[(odds_index(odds), chaos_factor)]
+    return base
+
+
+def thresholds(odds, chaos_factor):
+    """Returns the (exceptional yes, yes, exceptional no) thresholds, NO_THRESHOLD marking an 'X'."""
+    if chaos_factor not in CHAOS_FACTORS:
+        raise ValueError(f"Chaos factor must be between 1 and 9, got {chaos_factor!r}")
+    i = (odds_index(odds) * len(CHAOS_FACTORS) + chaos_factor - 1) * 3
+    return tuple(THRESHOLDS[i:i + 3])
+
+
+def resolve(odds, chaos_factor, roll):
+    """Resolves a single fate question roll into a result code."""
+    if not 1 <= roll <= 100:
+        raise ValueError(f"d100 roll must be between 1 and 100, got {roll!r}")
+    return OUTCOMES[_base(odds, chaos_factor) + roll]
+
+
+def resolve_many(questions):
+    """Resolves an iterable of (odds, chaos factor, d100) triples into a list of result codes."""
+    get_base = _BASES.get
+    outcomes = OUTCOMES
+    # Anything off the fast path (odds in another case, bad input) goes through resolve() for its checks
+    return [outcomes[base + roll] if (base := get_base((odds, chaos_factor))) is not None and 0 < roll <= 100
+            else resolve(odds, chaos_factor, roll)
+            for odds, chaos_factor, roll in questions]
+
+
+def ask(odds, chaos_factor, rng=None):
+    """Rolls d100 for a fate question and returns (roll, result code)."""
+    roll = (rng or random).randint(1, 100)
+    return roll, resolve(odds, chaos_factor, roll)
+
+
+def answer(result):
+    """Returns the answer label ('yes', 'exceptional no', ...) for a result code."""
+    return ANSWERS[result]
@@ -0,0 +1,33 @@
+import random
+from ..static_data.table_registry import TABLES_REGISTRY
+
+
+# Meaning rolls that draw from two different tables; every other table is rolled twice
+PAIRED_TABLES = {
+    "Actions": ("Action 1", "Action 2"),
+    "Descriptions": ("Descriptor 1", "Descriptor 2"),
+}
+
+_WORDS = {}
+
+
+def table_words(table_name):
+    """Returns a d100 table as a 100-entry tuple of words indexed by roll - 1."""
+    words = _WORDS.get(table_name)
+    if words is None:
+        table = sorted(TABLES_REGISTRY[table_name], key=lambda x: x[0])
+        if [entry[0] for entry in table] != list(range(1, 101)):
+            raise ValueError(f"{table_name} is not a d100 meaning table")
+        words = _WORDS[table_name] = tuple(entry[1] for entry in table)
+    return words
+
+
+def roll_meaning(table_name, count=1, rng=None):
+    """Returns count (word, word) pairs, drawn with a single call to the generator.
+
+    table_name is a key of PAIRED_TABLES or any d100 table in TABLES_REGISTRY.
+    """
+    first_name, second_name = PAIRED_TABLES.get(table_name, (table_name, table_name))
+    first, second = table_words(first_name), table_words(second_name)
+    rolls = (rng or random).choices(range(100), k=2 * count)
+    return [(first[i], second[j]) for i, j in zip(rolls[::2], rolls[1::2])]
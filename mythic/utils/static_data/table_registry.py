@@ -0,0 +1,94 @@
+import importlib
+import sys
+from collections.abc import Mapping
+
+
+# Same keys and order as TABLES_INDEX, pointing at the page module and attribute holding each table
+TABLE_SOURCES = {
+    "Fate Chart": ("page_194", "FATE_CHART"),
+    "Random Event Focus Table": ("page_197", "RANDOM_EVENT_FOCUS_TABLE"),
+    "Action 1": ("page_199", "ACTION_1"),
+    "Action 2": ("page_199", "ACTION_2"),
+    "Descriptor 1": ("page_200", "DESCRIPTOR_1"),
+    "Descriptor 2": ("page_200", "DESCRIPTOR_2"),
+    "Adventure Tone": ("page_201", "ADVENTURE_TONE"),
+    "Alien Species Descriptors": ("page_201", "ALIEN_SPECIES_DESCRIPTORS"),
+    "Animal Actions": ("page_201", "ANIMAL_ACTIONS"),
+    "Army Descriptors": ("page_202", "ARMY_DESCRIPTORS"),
+    "Cavern Descriptors": ("page_202", "CAVERN_DESCRIPTORS"),
+    "Characters": ("page_202", "CHARACTERS"),
+    "Character Actions Combat": ("page_203", "CHARACTER_ACTIONS_COMBAT"),
+    "Character Actions General": ("page_203", "CHARACTER_ACTIONS_GENERAL"),
+    "Character Appearance": ("page_203", "CHARACTER_APPEARANCE"),
+    "Character Background": ("page_204", "CHARACTER_BACKGROUND"),
+    "Character Conversations": ("page_204", "CHARACTER_CONVERSATIONS"),
+    "Character Descriptors": ("page_204", "CHARACTER_DESCRIPTORS"),
+    "Character Identity": ("page_205", "CHARACTER_IDENTITY"),
+    "Character Motivations": ("page_205", "CHARACTER_MOTIVATIONS"),
+    "Character Personality": ("page_205", "CHARACTER_PERSONALITY"),
+    "Character Skills": ("page_206", "CHARACTER_SKILLS"),
+    "Character Traits Flaws": ("page_206", "CHARACTER_TRAITS_FLAWS"),
+    "City Descriptors": ("page_206", "CITY_DESCRIPTORS"),
+    "Civilization Descriptors": ("page_207", "CIVILIZATION_DESCRIPTORS"),
+    "Creature Abilities": ("page_207", "CREATURE_ABILITIES"),
+    "Creature Descriptors": ("page_207", "CREATURE_DESCRIPTORS"),
+    "Cryptic Message": ("page_208", "CRYPTIC_MESSAGE"),
+    "Curses": ("page_208", "CURSES"),
+    "Domicile Descriptors": ("page_208", "DOMICILE_DESCRIPTORS"),
+    "Dungeon Descriptors": ("page_209", "DUNGEON_DESCRIPTORS"),
+    "Dungeon Traps": ("page_209", "DUNGEON_TRAPS"),
+    "Forest Descriptors": ("page_209", "FOREST_DESCRIPTORS"),
+    "Gods": ("page_210", "GODS"),
+    "Legends": ("page_210", "LEGENDS"),
+    "Locations": ("page_210", "LOCATIONS"),
+    "Magic Item Descriptors": ("page_211", "MAGIC_ITEM_DESCRIPTORS"),
+    "Mutation Descriptors": ("page_211", "MUTATION_DESCRIPTORS"),
+    "Names": ("page_211", "NAMES"),
+    "Noble House": ("page_212", "NOBLE_HOUSE"),
+    "Objects": ("page_212", "OBJECTS"),
+    "Plot Twists": ("page_212", "PLOT_TWISTS"),
+    "Powers": ("page_213", "POWERS"),
+    "Scavenging Results": ("page_213", "SCAVENGING_RESULTS"),
+    "Smells": ("page_213", "SMELLS"),
+    "Sounds": ("page_214", "SOUNDS"),
+    "Spell Effects": ("page_214", "SPELL_EFFECTS"),
+    "Starship Descriptors": ("page_214", "STARSHIP_DESCRIPTORS"),
+    "Terrain Descriptors": ("page_215", "TERRAIN_DESCRIPTORS"),
+    "Undead Descriptors": ("page_215", "UNDEAD_DESCRIPTORS"),
+    "Visions Dreams": ("page_215", "VISIONS_DREAMS"),
+}
+
+
+class TableRegistry(Mapping):
+    """Read-only mapping of table name to table that imports each page module on first access."""
+    def __init__(self, sources, package=__package__ + ".mythic_tables"):
+        self._sources = sources
+        self._package = package
+        self._tables = {}
+
+    def __getitem__(self, name):
+        try:
+            return self._tables[name]
+        except KeyError:
+            module_name, attribute = self._sources[name]  # Unknown names raise KeyError like a dict
+            module = importlib.import_module(f"{self._package}.{module_name}")
+            table = self._tables[name] = getattr(module, attribute)
+            return table
+
+    def __iter__(self):
+        return iter(self._sources)
+
+    def __len__(self):
+        return len(self._sources)
+
+    def is_resident(self, name):
+        """Returns True if the page module holding the table has been imported."""
+        module_name, _ = self._sources[name]
+        return f"{self._package}.{module_name}" in sys.modules
+
+    def resident(self):
+        """Returns the names of all tables currently held in memory."""
+        return [name for name in self._sources if self.is_resident(name)]
+
+
+TABLES_REGISTRY = TableRegistry(TABLE_SOURCES)
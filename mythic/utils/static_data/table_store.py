@@ -0,0 +1,149 @@
+import mmap
+import os
+import struct
+import sys
+from collections.abc import Sequence
+from .table_registry import TABLES_REGISTRY
+
+
+# File layout: header | table directory | entry offsets | UTF-8 string blob (all little-endian)
+MAGIC = b"MYTB"
+VERSION = 1
+HEADER = struct.Struct("<4sHH")  # magic, version, table count
+TABLE = struct.Struct("<IHII")   # name offset, name length, entry count, first entry
+ENTRY = struct.Struct("<HIH")    # number, text offset, text length
+
+DEFAULT_STORE_PATH = os.path.join(os.path.dirname(__file__), "meaning_tables.bin")
+
+
+def is_meaning_table(table):
+    """True for d100 tables made of (number, text) entries; the Fate Chart and Event Focus Table are not."""
+    return all(len(entry) == 2 and isinstance(entry[0], int) and isinstance(entry[1], str) for entry in table)
+
+
+def build_table_store(path=DEFAULT_STORE_PATH, tables=None):
+    """Packs every meaning table into a single binary file at path and returns the path."""
+    if tables is None:
+        tables = {name: table for name, table in TABLES_REGISTRY.items() if is_meaning_table(table)}
+
+    blob = bytearray()
+    directory = bytearray()
+    entries = bytearray()
+    entry_count = 0
+
+    def add_text(text):
+        encoded = text.encode("utf-8")
+        offset = len(blob)
+        blob.extend(encoded)
+        return offset, len(encoded)
+
+    for name, table in tables.items():
+        name_offset, name_length = add_text(name)
+        directory += TABLE.pack(name_offset, name_length, len(table), entry_count)
+        for number, text in sorted(table, key=lambda x: x[0]):
+            entries += ENTRY.pack(number, *add_text(text))
+        entry_count += len(table)
+
+    # Write next to the target and swap in, so readers never map a half-written file
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, len(tables)))
+        f.write(directory)
+        f.write(entries)
+        f.write(blob)
+    os.replace(tmp_path, path)
+    return path
+
+
+class PackedTable(Sequence):
+    """Sequence of (number, text) entries decoded from the store on access."""
+    def __init__(self, store, name, count, first_entry):
+        self.store = store
+        self.name = name
+        self._count = count
+        self._first_entry = first_entry
+
+    def __len__(self):
+        return self._count
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._count))]
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError(f"{self.name} has no entry {index}")
+        return self.store._decode_entry(self._first_entry + index)
+
+    def text(self, index):
+        """Returns only the text of the entry at index."""
+        return self[index][1]
+
+
+class TableStore:
+    """Read-only, memory-mapped view of a packed table file shared by every process that opens it."""
+    def __init__(self, path=DEFAULT_STORE_PATH):
+        self.path = path
+        with open(path, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, table_count = HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC or version != VERSION:
+            self._map.close()
+            raise ValueError(f"{path} is not a version {VERSION} table store")
+
+        entries_start = HEADER.size + table_count * TABLE.size
+        total_entries = 0
+        directory = []
+        for i in range(table_count):
+            directory.append(TABLE.unpack_from(self._map, HEADER.size + i * TABLE.size))
+            total_entries += directory[-1][2]
+        self._entries_start = entries_start
+        self._blob_start = entries_start + total_entries * ENTRY.size
+
+        self.tables = {}
+        for name_offset, name_length, count, first_entry in directory:
+            name = self._decode_text(name_offset, name_length)
+            self.tables[name] = PackedTable(self, name, count, first_entry)
+
+    def _decode_text(self, offset, length):
+        start = self._blob_start + offset
+        return self._map[start:start + length].decode("utf-8")
+
+    def _decode_entry(self, entry_index):
+        number, offset, length = ENTRY.unpack_from(self._map, self._entries_start + entry_index * ENTRY.size)
+        return number, self._decode_text(offset, length)
+
+    def __contains__(self, name):
+        return name in self.tables
+
+    def __getitem__(self, name):
+        return self.tables[name]
+
+    def lookup(self, name, number):
+        """Returns the text for a d100 number, relying on entries being stored sorted from 1."""
+        entry_number, text = self.tables[name][number - 1]
+        if entry_number != number:
+            raise KeyError(f"{name} has no entry numbered {number}")
+        return text
+
+    def close(self):
+        self._map.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def open_table_store(path=DEFAULT_STORE_PATH):
+    """Opens the packed store at path, building it first if it does not exist yet."""
+    if not os.path.exists(path):
+        build_table_store(path)
+    return TableStore(path)
+
+
+# Build step: python -m utils.static_data.table_store [output path]
+if __name__ == "__main__":
+    print(build_table_store(*sys.argv[1:2]))
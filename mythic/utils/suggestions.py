@@ -0,0 +1,111 @@
+import math
+from bisect import bisect_left, insort
+from collections import defaultdict
+
+
+def fold(text):
+    """Case- and whitespace-insensitive form used for matching."""
+    return " ".join(text.casefold().split())
+
+
+def trigrams(text):
+    """Returns the set of 3-character grams of each word of folded text, padded to mark word starts."""
+    grams = set()
+    for word in text.split(" "):
+        padded = f"  {word} "
+        grams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return grams
+
+
+class NameIndex:
+    """In-memory suggestion index over story entry names.
+
+    Exact matching uses a sorted array of (word, entry) keys, one per word of every name, so a
+    prefix lookup is a binary search followed by a short scan; the whole name and each later word
+    can match ("bo" and "smith" both find "Bob Smith"). When prefixes give fewer than `limit`
+    results, names containing enough of the typed text's trigrams fill the rest, which tolerates typos.
+    """
+    def __init__(self, entries=(), min_similarity=0.3):
+        self.min_similarity = min_similarity
+        self.entries = []  # (name, entry_type, entry_id)
+        self.folded = []  # Folded name per entry
+        self.grams = []  # Trigram set per entry
+        self.keys = []  # Sorted (folded word or whole name, entry position)
+        self.postings = defaultdict(list)  # Trigram -> entry positions
+        self.positions = {}  # (entry_type, entry_id) -> entry position
+        for entry in entries:
+            self.add(*entry, sort=False)
+        self.keys.sort()
+
+    def __len__(self):
+        return len(self.entries)
+
+    def add(self, name, entry_type, entry_id, sort=True):
+        """Adds a name; an entry already indexed under (entry_type, entry_id) is left as is."""
+        if not name or (entry_type, entry_id) in self.positions:
+            return
+        position = len(self.entries)
+        folded = fold(name)
+        self.entries.append((name, entry_type, entry_id))
+        self.folded.append(folded)
+        self.positions[(entry_type, entry_id)] = position
+        words = folded.split(" ")
+        keys = [(folded, position)] + [(word, position) for word in words[1:]]
+        for key in keys:
+            if sort:
+                insort(self.keys, key)
+            else:
+                self.keys.append(key)
+        grams = trigrams(folded)
+        self.grams.append(grams)
+        for gram in grams:
+            self.postings[gram].append(position)
+
+    def prefix_matches(self, prefix, limit):
+        """Returns entry positions with a name or word starting with the folded prefix, names first."""
+        whole, words = [], []
+        seen = set()
+        start = bisect_left(self.keys, (prefix, -1))
+        for key, position in self.keys[start:]:
+            if not key.startswith(prefix):
+                break
+            if position in seen:
+                continue
+            seen.add(position)
+            (whole if self.folded[position].startswith(prefix) else words).append(position)
+            if len(whole) >= limit:
+                break
+        return whole + words
+
+    def fuzzy_matches(self, text, exclude=()):
+        """Returns entry positions ranked by the share of text's trigrams found in their names, best first.
+
+        Ties are broken by Jaccard similarity, so shorter names that match equally well come first.
+        """
+        grams = trigrams(text)
+        # A name covering `needed` of the grams must hold one of the len - needed + 1 rarest ones,
+        # so only those posting lists are scanned for candidates
+        needed = max(1, math.ceil(self.min_similarity * len(grams)))
+        rarest = sorted(grams, key=lambda gram: len(self.postings.get(gram, ())))
+        candidates = set()
+        for gram in rarest[:len(grams) - needed + 1]:
+            candidates.update(self.postings.get(gram, ()))
+        scored = []
+        for position in candidates.difference(exclude):
+            count = len(grams & self.grams[position])
+            coverage = count / len(grams)
+            if coverage >= self.min_similarity:
+                jaccard = count / (len(grams) + len(self.grams[position]) - count)
+                scored.append((-coverage, -jaccard, self.folded[position], position))
+        scored.sort()
+        return [position for *_, position in scored]
+
+    def suggest(self, text, limit=8):
+        """Returns up to `limit` (name, entry_type, entry_id) matches for typed text, best first."""
+        text = fold(text)
+        if not text:
+            return []
+        matches = self.prefix_matches(text, limit)
+        if len(matches) < limit and len(text) >= 4:  # Shorter input shares too few trigrams to rank
+            matches += self.fuzzy_matches(text, exclude=set(matches))
+        return [self.entries[position] for position in matches[:limit]]
@@ -0,0 +1,91 @@
+import os
+from collections import OrderedDict
+from PySide6.QtGui import QPixmap
+from PIL import Image
+
+
+# Longest side in px of each downscaled variant, smallest first
+THUMBNAIL_SIZES = (256, 512, 1024)
+THUMBNAIL_DIR = ".thumbs"
+
+
+def thumbnail_path(image_path, size):
+    """Returns where the size px variant of image_path lives: <folder>/.thumbs/<name>_<size><ext>."""
+    folder, filename = os.path.split(image_path)
+    stem, ext = os.path.splitext(filename)
+    ext = ".jpg" if ext.lower() in (".jpg", ".jpeg") else ".png"
+    return os.path.join(folder, THUMBNAIL_DIR, f"{stem}_{size}{ext}")
+
+
+def generate_thumbnails(image_path, sizes=THUMBNAIL_SIZES):
+    """Writes the downscaled variants of image_path that are smaller than the image itself."""
+    with Image.open(image_path) as img:
+        img.load()
+        for size in sizes:
+            if max(img.size) <= size:
+                break  # The original already fits, larger variants would only be copies
+            path = thumbnail_path(image_path, size)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            variant = img.copy()
+            variant.thumbnail((size, size), Image.Resampling.LANCZOS)
+            if path.endswith(".jpg"):
+                variant.convert("RGB").save(path, quality=90)
+            else:
+                variant.save(path)
+
+
+def remove_thumbnails(image_path, sizes=THUMBNAIL_SIZES):
+    """Deletes every variant generated for image_path."""
+    for size in sizes:
+        try:
+            os.remove(thumbnail_path(image_path, size))
+        except FileNotFoundError:
+            pass
+
+
+class ThumbnailService:
+    """Serves the smallest stored variant of an image that covers a target size, with a pixmap LRU."""
+    def __init__(self, max_pixmaps=32, sizes=THUMBNAIL_SIZES):
+        self.max_pixmaps = max_pixmaps
+        self.sizes = sizes
+        self.pixmaps = OrderedDict()
+        self.image_sizes = {}  # (path, mtime) -> (width, height) of the original
+
+    def source_size(self, image_path, mtime):
+        key = (image_path, mtime)
+        if key not in self.image_sizes:
+            with Image.open(image_path) as img:  # Reads the header only
+                self.image_sizes[key] = img.size
+        return self.image_sizes[key]
+
+    def variant_for(self, image_path, target_size):
+        """Returns the path of the smallest variant at least as large as target_size in both dimensions."""
+        mtime = os.stat(image_path).st_mtime_ns
+        width, height = self.source_size(image_path, mtime)
+        target_width, target_height = target_size
+        for size in self.sizes:
+            scale = size / max(width, height)
+            if scale >= 1:
+                break  # Variants stop at the original's size
+            if width * scale >= target_width and height * scale >= target_height:
+                path = thumbnail_path(image_path, size)
+                if not os.path.exists(path) or os.stat(path).st_mtime_ns < mtime:
+                    generate_thumbnails(image_path, self.sizes)  # Missing or stale, e.g. images saved before thumbnails
+                return path
+        return image_path
+
+    def pixmap(self, image_path, target_size):
+        """Returns a pixmap of image_path to be scaled to target_size, decoding as little as possible."""
+        path = self.variant_for(image_path, target_size)
+        key = (path, os.stat(path).st_mtime_ns)
+        pixmap = self.pixmaps.get(key)
+        if pixmap is None:
+            pixmap = self.pixmaps[key] = QPixmap(path)
+            while len(self.pixmaps) > self.max_pixmaps:
+                self.pixmaps.popitem(last=False)
+        self.pixmaps.move_to_end(key)
+        return pixmap
+
+
+# Shared by every gallery modal so the LRU survives reopening it
+THUMBNAILS = ThumbnailService()
@@ -1,11 +1,51 @@
 from PySide6.QtWidgets import QWidget
+from sqlalchemy import select, literal, union_all, true
 from ui.gallery_ui import GalleryModalUI
 from models.db_config import session
 from models.master_tables import Characters, Places, Items, Notes
+from models.image_store import set_image_ref, stored_image_path, remove_image_files
+from models.notes_search import index_note_text
 
 
 MODEL_MAP = {"characters": Characters, "places": Places, "items": Items}
 
+
+def query_gallery_nav_items(story_index=None, limit=None, offset=None):
+    """Returns (type, id, name) for characters, places and items ordered by name, in one UNION ALL query.
+
+    With a story_index only that story's active entries are returned. Ties on name (and NULL names)
+    are broken by id, then type, so LIMIT/OFFSET pages never skip or repeat a row. Each arm of the
+    union reads a name index, whose entries end in the rowid (id), so SQLite merges the arms without
+    a sort; a constant type placed before id would need one.
+    """
+    selects = []
+    for nav_type, model in MODEL_MAP.items():
+        stmt = select(literal(nav_type).label("type"), model.id, model.name)
+        if story_index is not None:
+            stmt = stmt.where(model.story_index == story_index, model.active == true())
+        selects.append(stmt)
+    stmt = union_all(*selects).order_by("name", "id", "type").limit(limit).offset(offset)
+    return [tuple(row) for row in session.execute(stmt)]
+
+def save_uploaded_image(nav_key, image_path, digest):
+    """Saves the uploaded image path to the database and references it in the image store.
+
+    The entry points at the path recorded for the digest; a file the import wrote that no stored
+    image row uses (the entry was deleted meanwhile, or the image is stored under another name) is removed.
+    """
+    nav_type, nav_id = nav_key
+    model = MODEL_MAP.get(nav_type)
+    data = session.query(model).filter(model.id == nav_id).first() if model and nav_id else None
+    orphaned_images = []
+    if data:
+        orphaned_images = set_image_ref(session, nav_type, nav_id, data.story_index, digest, image_path)
+        data.image_path = stored_image_path(session, digest)
+        session.commit()
+    if stored_image_path(session, digest) != image_path:
+        orphaned_images.append(image_path)
+    remove_image_files(orphaned_images)
+
+
 class GalleryModalView(QWidget):
     """Handles main menu logic & navigation."""
 
@@ -14,24 +54,16 @@ class GalleryModalView(QWidget):
         self.controller = controller
         self.story_index = story_index
 
-        if self.story_index is None:
-            characters_list = [('characters', id, name) for id, name in session.query(Characters).with_entities(Characters.id, Characters.name).all()]
-            places_list = [('places', id, name) for id, name in session.query(Places).with_entities(Places.id, Places.name).all()]
-            items_list = [('items', id, name) for id, name in session.query(Items).with_entities(Items.id, Items.name).all()]
-        else:
-            characters_list = [('characters', id, name) for id, name in session.query(Characters).with_entities(Characters.id, Characters.name).filter(Characters.story_index == self.story_index, Characters.active == True).all()]
-            places_list = [('places', id, name) for id, name in session.query(Places).with_entities(Places.id, Places.name).filter(Places.story_index == self.story_index, Places.active == True).all()]
-            items_list = [('items', id, name) for id, name in session.query(Items).with_entities(Items.id, Items.name).filter(Items.story_index == self.story_index, Items.active == True).all()]
-
-        characters_nav_bar_list = sorted(characters_list + places_list + items_list, key=lambda x: x[2])
-
-        # Attach UI with navigation logic
-        self.ui = GalleryModalUI(self, controller, characters_nav_bar_list, first_nav_type=first_nav_type, first_nav_id=first_nav_id)
+        # Attach UI with navigation logic; the nav list pulls its rows page by page
+        self.ui = GalleryModalUI(self, controller, self.fetch_nav_items, first_nav_type=first_nav_type, first_nav_id=first_nav_id)
         self.ui.details_data_ready.connect(self.post_edited_nav_items_data)
         self.ui.close_modal.connect(self.navigate_to_game_dashboard)
-        self.ui.image_uploaded.connect(self.save_uploaded_image)
+        self.ui.image_import_started.connect(self.track_image_import)
         self.setLayout(self.ui.layout)  # Use UI's layout directly
 
+    def fetch_nav_items(self, limit, offset):
+        return query_gallery_nav_items(self.story_index, limit, offset)
+
     def navigate_to_game_dashboard(self):
         from views.game_dashboard import GameDashboardView
         self.controller.show_view(GameDashboardView, story_index=self.story_index)
@@ -51,6 +83,7 @@ class GalleryModalView(QWidget):
                         model_type = model_type[:-1]
                         notes_data = session.query(Notes).filter(Notes.type == model_type, Notes.type_id == model_id).first()
                         notes_data.notes = notes_edited_data
+                        index_note_text(session, notes_data)
                         
                     session.commit()
 
@@ -67,14 +100,9 @@ class GalleryModalView(QWidget):
             return data
         return {}
     
-    def save_uploaded_image(self, image_path):
-        """Saves the uploaded image path to the database."""
-        if self.ui.current_nav_type and self.ui.current_nav_id:
-            model = MODEL_MAP[self.ui.current_nav_type]
-            data = session.query(model).filter(model.id == self.ui.current_nav_id).first()
-            if data:
-                data.image_path = image_path
-                session.commit()
+    def track_image_import(self, task):
+        """Saves the image path once the import finishes, even if this modal has been closed by then."""
+        task.signals.finished.connect(save_uploaded_image)
 
     def get_background_image(self):
         """Returns the background image path for this view."""
@@ -2,12 +2,15 @@ from PySide6.QtWidgets import QWidget
 from ui.game_dashboard_ui import GameDashboardUI  # Assuming MainMenuUI is adapted for PySide6
 from models.master_tables import StoriesIndex, Characters, Places, Items, Notes
 from models.db_config import session
+from utils.suggestions import NameIndex
  
 
 MODEL_MAP = {"character": Characters, "place": Places, "item": Items}
 
 class GameDashboardView(QWidget):
     """Handles main menu logic & navigation."""
+    cacheable = True
+
     def __init__(self, parent, controller, story_index=None):
         super().__init__(parent)
         self.controller = controller
@@ -22,6 +25,11 @@ class GameDashboardView(QWidget):
         self.ui.main_menu_button_clicked.connect(lambda: self.navigate_to_main_menu())
         self.setLayout(self.ui.layout)  # Use UI's layout directly
 
+    def refresh(self):
+        """Reloads the story title when the cached dashboard is shown again."""
+        self.story_name, self.description = session.query(StoriesIndex).filter(StoriesIndex.index == self.story_index).with_entities(StoriesIndex.name, StoriesIndex.description).first()
+        self.ui.title_label.setText(self.story_name)
+
     def navigate_to_characters_list(self, story_index):
         self.controller.show_view(CharactersList, story_index=story_index)
 
@@ -47,16 +55,15 @@ class CharactersList(QWidget):
     """Handles main menu logic & navigation."""
     def __init__(self, parent, controller, story_index=None):
         from ui.game_dashboard_ui import CharactersThreadsTablesUI
-        from models.story_tables import create_dynamic_model, CharactersList as CharactersListModel
+        from models.story_tables import StoryList
 
         super().__init__(parent)
         self.controller = controller
         self.story_index = story_index
-        self.table_name = str(self.story_index) + "_characters_list"
+        self.story_list = StoryList(self.story_index, "characters")
+        self.characters_list_model = self.story_list.model
 
-        self.characters_list_model = create_dynamic_model(CharactersListModel, self.table_name)
-
-        existing_data_queryset = session.query(self.characters_list_model).all()
+        existing_data_queryset = self.story_list.query(session).all()
         existing_data = {}
         for data in existing_data_queryset:
             existing_data[data.row] = {
@@ -64,6 +71,7 @@ class CharactersList(QWidget):
                 "type": data.type,
                 "master_id": data.master_id
             }
+        self.name_index = self.build_name_index()  # Suggestions while typing names
 
         # Attach UI with navigation logic
         self.ui = CharactersThreadsTablesUI(self, controller, "characters", self.story_index, existing_data)
@@ -71,13 +79,22 @@ class CharactersList(QWidget):
         self.ui.row_clicked.connect(self.receive_clicked_row_data)
         self.setLayout(self.ui.layout)  # Use UI's layout directly
         
+    def build_name_index(self):
+        """Indexes the names of the story's characters, places and items for suggestions."""
+        entries = []
+        for entry_type, model in MODEL_MAP.items():
+            rows = session.query(model.name, model.id).filter(model.story_index == self.story_index)
+            entries.extend((name, entry_type, entry_id) for name, entry_id in rows)
+        return NameIndex(entries)
+
     def send_matching_suggestions_for_row(self, current_typed_data_dict):
-        print(f"Current typed data in row {current_typed_data_dict['row']} is {current_typed_data_dict['data']}")
+        matches = self.name_index.suggest(current_typed_data_dict["data"])
+        self.ui.show_suggestions(current_typed_data_dict["row"], [(name, entry_type) for name, entry_type, _ in matches])
 
     def receive_clicked_row_data(self, data):
         from views.gallery import GalleryModalView
         if data['name']:
-            result = session.query(self.characters_list_model).filter(
+            result = self.story_list.query(session).filter(
                 self.characters_list_model.row == data['row_index'],
                 self.characters_list_model.name == data['name'],
                 self.characters_list_model.type == data['type']
@@ -105,7 +122,7 @@ class CharactersList(QWidget):
                         duplicates[0].story_index = self.story_index
                         existing_master_data_id = duplicates[0].id
 
-                        session.query(self.characters_list_model).filter(self.characters_list_model.row == row).update({
+                        self.story_list.save_row(session, row, {
                             "name": name_type_data["name"],
                             "type": name_type_data["type"],
                             "master_id": existing_master_data_id
@@ -121,12 +138,13 @@ class CharactersList(QWidget):
                 session.add(new_master_data)
                 session.flush()
                 new_master_data_id = new_master_data.id
+                self.name_index.add(name_type_data["name"], name_type_data["type"], new_master_data_id)
                 
                 new_notes_add = Notes(type=name_type_data["type"], type_id=new_master_data_id, story_index=self.story_index)
                 session.add(new_notes_add)
 
                 # Update the dynamic characters list table specific to the story
-                session.query(self.characters_list_model).filter(self.characters_list_model.row == row).update({
+                self.story_list.save_row(session, row, {
                     "name": name_type_data["name"],
                     "type": name_type_data["type"],
                     "master_id": new_master_data_id
@@ -144,16 +162,15 @@ class ThreadsList(QWidget):
     """Handles main menu logic & navigation."""
     def __init__(self, parent, controller, story_index=None):
         from ui.game_dashboard_ui import CharactersThreadsTablesUI
-        from models.story_tables import create_dynamic_model, ThreadsList as ThreadsListModel
+        from models.story_tables import StoryList
 
         super().__init__(parent)
         self.controller = controller
         self.story_index = story_index
-        self.table_name = str(self.story_index) + "_threads_list"
-
-        self.threads_list_model = create_dynamic_model(ThreadsListModel, self.table_name)
+        self.story_list = StoryList(self.story_index, "threads")
+        self.threads_list_model = self.story_list.model
 
-        existing_data_queryset = session.query(self.threads_list_model).all()
+        existing_data_queryset = self.story_list.query(session).all()
         existing_data = {}
         for data in existing_data_queryset:
             existing_data[data.row] = {
@@ -167,7 +184,7 @@ class ThreadsList(QWidget):
     def receive_edited_rows_data(self, data):
         """Receives edited data from UI when closing."""
         for row, thread_data in data.items():
-            session.query(self.threads_list_model).filter(self.threads_list_model.row == row).update({"thread": thread_data["thread"]})
+            self.story_list.save_row(session, row, {"thread": thread_data["thread"]})
             session.commit()
 
     def get_background_image(self):
@@ -1,16 +1,18 @@
 from PySide6.QtWidgets import QWidget, QVBoxLayout
 from ui.main_menu_ui import MainMenuUI
-from models.db_config import session, engine
-from sqlalchemy import inspect
-from utils.static_data.tables_index import TABLES_INDEX
+from models.db_config import session
+from utils.static_data.table_registry import TABLES_REGISTRY
 from models.master_tables import StoriesIndex, Characters, Places, Items, Notes, Threads
-from models.story_tables import create_dynamic_model, CharactersList as CharactersListModel, ThreadsList as ThreadsListModel
-import os
-import glob
+from models.story_tables import StoryList
+from models.image_store import release_story_images, remove_image_files
+from models.notes_search import remove_story_notes_text
+from models.story_rng import new_story_rng
 
 
 class MainMenu(QWidget):
     """Handles main menu logic & navigation."""
+    cacheable = True
+
     def __init__(self, parent, controller):
         super().__init__(parent)
         self.controller = controller
@@ -39,7 +41,6 @@ class NewStoryView(QWidget):
     def validate_new_story_data_setup_tables(self, data):
         """Receives edited data, validates uniqueness, and updates UI accordingly."""
         from models.master_tables import StoriesIndex
-        from models.story_tables import create_dynamic_model, CharactersList, ThreadsList
 
         # Check if the title already exists
         existing_story = session.query(StoriesIndex).filter_by(name=data['title']).first()
@@ -55,27 +56,10 @@ class NewStoryView(QWidget):
             first_empty_index.name = data['title']
             first_empty_index.description = data['description']
 
-            inspector = inspect(engine)
-            characters_list_table_name = str(first_empty_index.index) + "_characters_list"
-            threads_list_table_name = str(first_empty_index.index) + "_threads_list"
-
-            if not inspector.has_table(characters_list_table_name):
-                characters_list_model = create_dynamic_model(CharactersList, characters_list_table_name)
-                characters_list_model.__table__.create(engine)
-                session.bulk_insert_mappings(
-                    characters_list_model,
-                    [{"row": i, "name": None, "type": None} for i in range(1,26)]
-                )
-
-            session.commit()                
-
-            if not inspector.has_table(threads_list_table_name):
-                threads_list_model = create_dynamic_model(ThreadsList, threads_list_table_name)
-                threads_list_model.__table__.create(engine)
-                session.bulk_insert_mappings(                
-                    threads_list_model,
-                    [{"row": i, "thread": None} for i in range(1,26)]
-                )                
+            # Set up the story's characters and threads lists with empty rows
+            StoryList(first_empty_index.index, "characters").create(session)
+            StoryList(first_empty_index.index, "threads").create(session)
+            new_story_rng(session, first_empty_index.index)
 
             session.commit()
             # Send the index value back to the UI so it can be used in navigation
@@ -127,37 +111,28 @@ class ExistingStoryView(QWidget):
 
     def delete_story(self, index):
         """Deletes the selected story."""
-        characters_table_name = str(index) + "_characters_list"
-        threads_table_name = str(index) + "_threads_list"
-
-        characters_list_model = create_dynamic_model(CharactersListModel, characters_table_name)
-        threads_list_model = create_dynamic_model(ThreadsListModel, threads_table_name)
         # Clear slot from stories index and remove all story records from master tables
         session.query(StoriesIndex).filter(StoriesIndex.index == index).update({
             StoriesIndex.name: None,
             StoriesIndex.description: None,
             StoriesIndex.created_date: None,
-            StoriesIndex.modified_date: None
+            StoriesIndex.modified_date: None,
+            StoriesIndex.rng_state: None
         })
         session.query(Characters).filter(Characters.story_index == index).delete()
         session.query(Places).filter(Places.story_index == index).delete()
         session.query(Items).filter(Items.story_index == index).delete()
         session.query(Threads).filter(Threads.story_index == index).delete()
         session.query(Notes).filter(Notes.story_index == index).delete()
+        remove_story_notes_text(session, index)
+        # Remove the story's characters and threads lists
+        StoryList(index, "characters").drop(session)
+        StoryList(index, "threads").drop(session)
+        # Release the story's images; files still used by other stories stay in the store
+        orphaned_images = release_story_images(session, index)
         session.commit()
         session.close()
-        # Remove all images for that story
-        folders = ["visuals/characters", "visuals/items", "visuals/places", "visuals/threads"]
-        for folder in folders:
-            pattern = os.path.join(folder, f"{index}_*")
-            for file_path in glob.glob(pattern):
-                try:
-                    os.remove(file_path)
-                except Exception as e:
-                    print(f"Failed to remove {file_path}: {e}")
-        # Drop the story-specific tables
-        characters_list_model.__table__.drop(engine)
-        threads_list_model.__table__.drop(engine)
+        remove_image_files(orphaned_images)
 
         self.controller.show_view(ExistingStoryView)
 
@@ -168,6 +143,8 @@ class ExistingStoryView(QWidget):
 
 class OraclesTablesView(QWidget):
     """Handles main menu layout & navigation."""
+    cacheable = True
+
     def __init__(self, parent, controller):
         # from ui.main_menu_ui import OraclesTablesUI
         from ui.main_menu_ui import OraclesTablesUI
@@ -179,13 +156,16 @@ class OraclesTablesView(QWidget):
         self.bg_image_path = "assets/page1_bg.jpg"
 
         # Attach UI with navigation logic
-        self.ui = OraclesTablesUI(self, controller, list(TABLES_INDEX.keys()))
+        self.ui = OraclesTablesUI(self, controller, list(TABLES_REGISTRY.keys()))
         self.ui.nav_item_selected.connect(self.get_table_data)
         # Layout to ensure proper expansion
         self.setLayout(self.ui.layout)
 
     def get_table_data(self, nav_item):
-        table = TABLES_INDEX.get(nav_item)
+        # Tables are rendered once; revisiting one only flips the page
+        if self.ui.show_table_page(nav_item):
+            return
+        table = TABLES_REGISTRY.get(nav_item)
         if nav_item == "Fate Chart":
             self.ui.render_fate_chart(nav_item, table)
         elif nav_item == "Random Event Focus Table":
@@ -196,6 +176,8 @@ class OraclesTablesView(QWidget):
 
 class GalleryView(QWidget):
     """Handles main menu layout & navigation."""
+    cacheable = True
+
     def __init__(self, parent, controller):
         from ui.main_menu_ui import GalleryUI
 
@@ -216,6 +198,8 @@ class GalleryView(QWidget):
 
 class ArtifactsView(QWidget):
     """Handles main menu layout & navigation."""
+    cacheable = True
+
     def __init__(self, parent, controller):
         from ui.main_menu_ui import ArtifactsUI
 
@@ -0,0 +1,55 @@
+from collections import OrderedDict
+
+
+class ViewManager:
+    """Creates the views shown in the main window's QStackedWidget, caching the reusable ones.
+
+    A view opts into caching with a class attribute `cacheable = True`. Cached views are keyed by
+    (view class, kwargs), kept in LRU order up to max_cached, and get their optional `refresh()`
+    called when shown again instead of being rebuilt. Every other view is removed from the stack
+    and deleted once the user navigates away from it.
+    """
+    def __init__(self, container, controller, max_cached=6):
+        self.container = container
+        self.controller = controller
+        self.max_cached = max_cached
+        self.cached_views = OrderedDict()
+        self.current_view = None
+
+    def show(self, view_class, **kwargs):
+        """Returns the view for view_class and kwargs, made current in the container."""
+        cacheable = getattr(view_class, "cacheable", False)
+        key = (view_class, tuple(sorted(kwargs.items())))
+        view = self.cached_views.get(key) if cacheable else None
+
+        if view is not None:
+            self.cached_views.move_to_end(key)
+            if hasattr(view, "refresh"):
+                view.refresh()
+        else:
+            view = view_class(self.container, self.controller, **kwargs)
+            self.container.addWidget(view)
+            if cacheable:
+                self.cached_views[key] = view
+
+        previous_view = self.current_view
+        self.container.setCurrentWidget(view)
+        self.current_view = view
+
+        if previous_view is not None and previous_view is not view and previous_view not in self.cached_views.values():
+            self.dispose(previous_view)
+        self.evict()
+        return view
+
+    def evict(self):
+        """Deletes the least recently used cached views beyond max_cached."""
+        for key in list(self.cached_views):
+            if len(self.cached_views) <= self.max_cached:
+                break
+            if self.cached_views[key] is not self.current_view:
+                self.dispose(self.cached_views.pop(key))
+
+    def dispose(self, view):
+        """Removes a view from the stack and schedules its widget tree for deletion."""
+        self.container.removeWidget(view)
+        view.deleteLater()